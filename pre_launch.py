@@ -7,12 +7,30 @@ Running before main.py ensures no packages are locked by the Python process.
 Called from the batch file launcher.
 """
 import os
+import re
 import sys
 import subprocess
 import shutil
 import shlex
+import stat
+import hashlib
+import json
+import io
+import functools
+import threading
+import time
+import importlib.util
+import importlib.metadata as _im
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from packaging.utils import canonicalize_name
+except ImportError:
+    def canonicalize_name(name):
+        """Fallback PEP 503 name normalization when packaging is unavailable."""
+        return name.lower().replace('_', '-').replace('.', '-')
+
 # Global to track torch index URL from pending installs
 _torch_index_url = None
 
@@ -21,12 +39,47 @@ _uv_cmd = None
 _uv_is_standalone = False
 _uv_checked = False
 
+# uv unpacks one wheel per CPU by default, which thrashes the disk on big boxes
+# (and NTFS handles many small files poorly). Cap it unless the user chose a value;
+# uv subprocesses inherit this.
+os.environ.setdefault('UV_CONCURRENT_INSTALLS', str(min(os.cpu_count() or 4, 16 if os.name == 'nt' else 32)))
+
+# Block size used when streaming downloads and archive members to disk
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Suffixes of package metadata directories in site-packages
+METADATA_SUFFIXES = ('.dist-info', '.dist_info', '.egg-info', '.egg_info')
+
+# Characters that make shlex.split differ from str.split
+_SHLEX_SPECIAL = frozenset('"\'\\')
+
+# Requirement line patterns used by parse_requirement
+_REQ_RE = re.compile(r'^([a-zA-Z0-9_-]+)(\[[^\]]+\])?(.*)$')
+_COMMENT_OR_OPTION = re.compile(r'^[-#]')
+
+# Global for packaging.version, imported on first use by version_satisfies
+_pkg_version = None
+
+# Serializes log output from worker threads
+_print_lock = threading.Lock()
+
+# Global to cache the resolved (pip_base, is_uv, is_standalone) tuple
+_pip_base_cache = None
 
+
+def _log(message):
+    """Print a log line without interleaving it with other threads' output."""
+    with _print_lock:
+        print(message, flush=True)
+
+
+@functools.lru_cache(maxsize=1)
 def _is_embedded_python():
     """Check if running in embedded Python (portable install)."""
     return "python_embeded" in sys.executable.lower()
 
 
+@functools.lru_cache(maxsize=1)
 def _get_uv_paths():
     """Get platform-specific uv paths."""
     if sys.platform == "win32":
@@ -48,6 +101,7 @@ def _get_uv_paths():
 
 def _install_uv():
     """Install uv to the platform-specific location if not already present."""
+    global _pip_base_cache
     uv_dir, uv_exe, download_url = _get_uv_paths()
     
     if uv_exe.exists():
@@ -57,48 +111,69 @@ def _install_uv():
         uv_dir.mkdir(parents=True, exist_ok=True)
         
         import urllib.request
-        import tempfile
+        
+        # The archive is small enough to hold in memory, which skips a temp file write + re-read
+        _log("[Nuvu Pre-Launch] Downloading uv...")
+        archive = io.BytesIO()
+        with urllib.request.urlopen(download_url, timeout=60) as response:
+            shutil.copyfileobj(response, archive, _COPY_CHUNK_SIZE)
+        archive.seek(0)
         
         if sys.platform == "win32":
             import zipfile
-            print("[Nuvu Pre-Launch] Downloading uv...", flush=True)
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
-                urllib.request.urlretrieve(download_url, tmp.name)
-                with zipfile.ZipFile(tmp.name, 'r') as zf:
-                    for member in zf.namelist():
-                        if member.endswith("uv.exe"):
-                            with zf.open(member) as src, open(uv_exe, 'wb') as dst:
-                                dst.write(src.read())
-                            break
-                Path(tmp.name).unlink(missing_ok=True)
+            with zipfile.ZipFile(archive, 'r') as zf:
+                for member in zf.namelist():
+                    if member.endswith("uv.exe"):
+                        with zf.open(member) as src, open(uv_exe, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+                        break
         else:
             import tarfile
-            print("[Nuvu Pre-Launch] Downloading uv...", flush=True)
-            with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp:
-                urllib.request.urlretrieve(download_url, tmp.name)
-                with tarfile.open(tmp.name, 'r:gz') as tf:
-                    for member in tf.getmembers():
-                        if member.name.endswith("/uv") or member.name == "uv":
-                            member.name = "uv"
-                            tf.extract(member, uv_dir)
-                            break
-                import os
-                os.chmod(uv_exe, 0o755)
-                Path(tmp.name).unlink(missing_ok=True)
+            with tarfile.open(fileobj=archive, mode='r:gz') as tf:
+                # Iterate lazily so we stop decompressing once uv is found
+                for member in tf:
+                    if member.name.endswith("/uv") or member.name == "uv":
+                        with tf.extractfile(member) as src, open(uv_exe, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+                        break
+            os.chmod(uv_exe, 0o755)
         
         if uv_exe.exists():
-            print(f"[Nuvu Pre-Launch] uv installed to {uv_exe}", flush=True)
+            _log(f"[Nuvu Pre-Launch] uv installed to {uv_exe}")
+            # A new uv is available, so any cached pip command is stale
+            _pip_base_cache = None
             return str(uv_exe)
     except Exception as e:
-        print(f"[Nuvu Pre-Launch] Failed to install uv: {e}", flush=True)
+        _log(f"[Nuvu Pre-Launch] Failed to install uv: {e}")
     
     return None
 
 
+def _is_executable_file(path):
+    """Check that path is a file we can execute, without spawning it."""
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _log_uv_version(uv_cmd, source):
+    """Log which uv was selected, including its version when NUVU_VERBOSE is set."""
+    version = ""
+    if os.environ.get("NUVU_VERBOSE"):
+        try:
+            result = subprocess.run(uv_cmd[:-1] + ["--version"], capture_output=True, text=True, timeout=2)
+            if result.returncode == 0:
+                version = f": {result.stdout.strip()}"
+        except Exception:
+            pass
+    _log(f"[Nuvu Pre-Launch] Using uv ({source}){version}")
+
+
 def _get_uv_cmd():
     """
     Get the uv command if available, otherwise None.
     
+    Candidates are detected with importlib/stat checks instead of running
+    `uv --version` for each one, so no subprocess is spawned on the common path.
+    
     Returns (cmd, is_standalone) tuple where:
     - cmd: list like ['path/to/uv.exe', 'pip'] or None if uv not available
     - is_standalone: True if using standalone uv.exe (needs --python flag)
@@ -112,64 +187,40 @@ def _get_uv_cmd():
     
     # Try uv as a Python module first (preferred - uses invoking Python automatically)
     try:
-        base = [sys.executable]
-        if _is_embedded_python():
-            base.append("-s")
-        
-        test_cmd = base + ["-m", "uv", "--version"]
-        result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            print(f"[Nuvu Pre-Launch] Using uv (module): {result.stdout.strip()}", flush=True)
+        if importlib.util.find_spec("uv") is not None:
+            base = [sys.executable]
+            if _is_embedded_python():
+                base.append("-s")
             _uv_cmd = base + ["-m", "uv", "pip"]
             _uv_is_standalone = False
+            _log_uv_version(_uv_cmd, "module")
             return _uv_cmd, _uv_is_standalone
     except Exception:
         pass
     
-    # Try standalone uv executable - check nuvu install location first
+    # Try standalone uv executable - check nuvu install location first, then other common locations
     _, nuvu_uv_exe, _ = _get_uv_paths()
-    if nuvu_uv_exe.exists():
-        try:
-            result = subprocess.run([str(nuvu_uv_exe), "--version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                print(f"[Nuvu Pre-Launch] Using uv (standalone): {result.stdout.strip()}", flush=True)
-                _uv_cmd = [str(nuvu_uv_exe), "pip"]
-                _uv_is_standalone = True
-                return _uv_cmd, _uv_is_standalone
-        except Exception:
-            pass
-    
-    # Try other common locations
     script_dir = Path(__file__).parent
     uv_locations = [
+        nuvu_uv_exe,
         script_dir / ".nuvu" / "bin" / ("uv.exe" if sys.platform == "win32" else "uv"),
         Path(sys.executable).parent / ("uv.exe" if sys.platform == "win32" else "uv"),
     ]
     
-    for uv_path in uv_locations:
-        if uv_path.exists():
-            try:
-                result = subprocess.run([str(uv_path), "--version"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    print(f"[Nuvu Pre-Launch] Using uv (standalone): {result.stdout.strip()}", flush=True)
-                    _uv_cmd = [str(uv_path), "pip"]
-                    _uv_is_standalone = True
-                    return _uv_cmd, _uv_is_standalone
-            except Exception:
-                pass
+    candidates = [str(p) for p in uv_locations if _is_executable_file(p)]
+    if candidates:
+        _uv_cmd = [candidates[0], "pip"]
+        _uv_is_standalone = True
+        _log_uv_version(_uv_cmd, "standalone")
+        return _uv_cmd, _uv_is_standalone
     
     # Try system PATH
     uv_path = shutil.which("uv")
     if uv_path:
-        try:
-            result = subprocess.run([uv_path, "--version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                print(f"[Nuvu Pre-Launch] Using uv (PATH): {result.stdout.strip()}", flush=True)
-                _uv_cmd = [uv_path, "pip"]
-                _uv_is_standalone = True
-                return _uv_cmd, _uv_is_standalone
-        except Exception:
-            pass
+        _uv_cmd = [uv_path, "pip"]
+        _uv_is_standalone = True
+        _log_uv_version(_uv_cmd, "PATH")
+        return _uv_cmd, _uv_is_standalone
     
     # Try to install uv
     installed_path = _install_uv()
@@ -182,20 +233,30 @@ def _get_uv_cmd():
 
 
 def _get_pip_base():
-    """Get the base pip command (uses uv if available, otherwise pip)."""
+    """Get the base pip command (uses uv if available, otherwise pip).
+    
+    The result is cached for the lifetime of the process.
+    """
+    global _pip_base_cache
+    
+    if _pip_base_cache is not None:
+        return _pip_base_cache
+    
     uv_cmd, is_standalone_uv = _get_uv_cmd()
     
     if uv_cmd:
         # For standalone uv on embedded Python, we need --python to target correct Python
         # For uv as module, it uses the Python that invoked it
-        return uv_cmd, True, is_standalone_uv  # Returns (cmd, is_uv, is_standalone)
+        _pip_base_cache = (uv_cmd, True, is_standalone_uv)  # (cmd, is_uv, is_standalone)
+        return _pip_base_cache
     
     # Fall back to pip
     pip_base = [sys.executable]
     if _is_embedded_python():
         pip_base.append('-s')
     pip_base.extend(['-m', 'pip'])
-    return pip_base, False, False
+    _pip_base_cache = (pip_base, False, False)
+    return _pip_base_cache
 
 
 def get_nuvu_dir():
@@ -216,6 +277,12 @@ def get_pending_uninstalls_dir():
     return os.path.join(get_nuvu_dir(), 'pending_uninstalls')
 
 
+def list_marker_files(pending_dir):
+    """List the *.txt marker files in a pending directory as os.DirEntry objects."""
+    with os.scandir(pending_dir) as entries:
+        return [e for e in entries if e.name.endswith('.txt') and e.is_file()]
+
+
 def get_torch_index_file():
     return os.path.join(get_nuvu_dir(), 'torch_index_url.txt')
 
@@ -264,7 +331,6 @@ def extract_package_names(spec_parts):
         elif part.startswith('-'):
             continue
         else:
-            import re
             pkg_name = re.split(r'[<>=!]', part)[0]
             if pkg_name:
                 packages.append(pkg_name)
@@ -280,42 +346,122 @@ def extract_index_url(spec_parts):
     return None
 
 
-def force_delete_package(pkg_name):
-    """Force delete a package from site-packages."""
+# Antivirus and indexers hold freshly touched files open for a moment on
+# Windows; back off briefly before giving up on a locked file. The budget caps
+# the total wait per _rmtree call, so a tree full of held files still fails
+# fast and is left for the next restart.
+_LOCKED_FILE_DEADLINE = 0.5
+_LOCKED_TREE_BUDGET = 1.5
+
+
+def _chmod_and_retry(func, path, _exc, budget_deadline=None):
+    """rmtree error handler: clear the read-only bit (common on Windows) and retry.
+    
+    Sharing violations on Windows are retried with exponential backoff
+    (1 ms doubling up to 250 ms) until _LOCKED_FILE_DEADLINE has passed,
+    or budget_deadline (a time.monotonic() value) if that comes first.
+    """
+    try:
+        os.chmod(path, stat.S_IWRITE)
+    except OSError:
+        pass
+    deadline = time.monotonic() + _LOCKED_FILE_DEADLINE
+    if budget_deadline is not None:
+        deadline = min(deadline, budget_deadline)
+    delay = 0.001
+    while True:
+        try:
+            func(path)
+            return
+        except PermissionError:
+            if os.name != 'nt' or time.monotonic() + delay > deadline:
+                return
+        except Exception:
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 0.25)
+
+
+def _rmtree(path):
+    """Remove a directory tree, retrying read-only files instead of leaving them behind."""
+    handler = functools.partial(_chmod_and_retry, budget_deadline=time.monotonic() + _LOCKED_TREE_BUDGET)
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=handler)
+    else:
+        shutil.rmtree(path, onerror=handler)
+
+
+def parse_pending_spec(spec):
+    """Parse a pending install spec into (spec_parts, package_names, index_url).
+    
+    Structured specs like {"spec": ["torch==2.4.0"], "index_url": "...", "packages": ["torch"]}
+    (a dict, or the same object as a JSON string) are used directly. Plain strings
+    are legacy markers and are split with shlex.
+    """
+    if isinstance(spec, str):
+        spec = spec.strip()
+        if spec.startswith('{'):
+            spec = json.loads(spec)
+    
+    if isinstance(spec, dict):
+        spec_parts = list(spec.get('spec') or [])
+        index_url = spec.get('index_url')
+        if index_url and '--index-url' not in spec_parts:
+            spec_parts = ['--index-url', index_url] + spec_parts
+        package_names = spec.get('packages') or extract_package_names(spec_parts)
+        return spec_parts, list(package_names), index_url
+    
+    # Most legacy specs are plain words; skip the shlex lexer unless quoting is involved
+    spec_parts = spec.split() if _SHLEX_SPECIAL.isdisjoint(spec) else shlex.split(spec)
+    return spec_parts, extract_package_names(spec_parts), extract_index_url(spec_parts)
+
+
+@functools.lru_cache(maxsize=1)
+def _site_packages_dirs():
+    """Existing site-packages directories (global and user), looked up once per process."""
     import site
-    import re
     
-    site_packages_dirs = site.getsitepackages()
+    dirs = list(site.getsitepackages())
     if hasattr(site, 'getusersitepackages'):
         user_site = site.getusersitepackages()
         if user_site:
-            site_packages_dirs.append(user_site)
-    
+            dirs.append(user_site)
+    return tuple(d for d in dirs if os.path.isdir(d))
+
+
+def force_delete_package(pkg_name):
+    """Force delete a package from site-packages."""
     pkg_normalized = pkg_name.lower().replace('-', '_')
-    deleted = False
+    # Metadata dirs look like {package}_{version}.dist_info once '-' is normalized to '_'
+    metadata_pattern = re.compile(rf'^{re.escape(pkg_normalized)}_\d')
+    paths = []
     
-    for sp_dir in site_packages_dirs:
-        if not os.path.isdir(sp_dir):
-            continue
-        
+    for sp_dir in _site_packages_dirs():
         try:
-            for item in os.listdir(sp_dir):
-                item_lower = item.lower().replace('-', '_')
-                is_exact_match = item_lower == pkg_normalized
-                is_metadata = bool(re.match(rf'^{re.escape(pkg_normalized)}_\d', item_lower)) and \
-                              ('dist_info' in item_lower or 'dist-info' in item_lower or 
-                               'egg_info' in item_lower or 'egg-info' in item_lower)
-                
-                if is_exact_match or is_metadata:
-                    item_path = os.path.join(sp_dir, item)
-                    if os.path.isdir(item_path):
-                        print(f"[Nuvu Pre-Launch] Force deleting: {item_path}", flush=True)
-                        shutil.rmtree(item_path, ignore_errors=True)
-                        deleted = True
+            with os.scandir(sp_dir) as entries:
+                for entry in entries:
+                    # Cheap first-character check before normalizing the whole name
+                    if entry.name[:1].lower() != pkg_normalized[:1]:
+                        continue
+                    item_lower = entry.name.lower().replace('-', '_')
+                    is_exact_match = item_lower == pkg_normalized
+                    is_metadata = item_lower.endswith(METADATA_SUFFIXES) and \
+                                  metadata_pattern.match(item_lower) is not None
+                    
+                    if (is_exact_match or is_metadata) and entry.is_dir(follow_symlinks=False):
+                        _log(f"[Nuvu Pre-Launch] Force deleting: {entry.path}")
+                        paths.append(entry.path)
         except Exception:
             pass
     
-    return deleted
+    # rmtree is dominated by per-file delete syscalls, so independent trees delete well in parallel
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(4, len(paths))) as executor:
+            list(executor.map(_rmtree, paths))
+    elif paths:
+        _rmtree(paths[0])
+    
+    return bool(paths)
 
 
 def run_pending_uninstalls():
@@ -325,52 +471,176 @@ def run_pending_uninstalls():
     if not os.path.isdir(pending_dir):
         return
     
-    markers = [f for f in os.listdir(pending_dir) if f.endswith('.txt')]
+    markers = list_marker_files(pending_dir)
     if not markers:
         return
     
-    print(f"\n[Nuvu Pre-Launch] Processing {len(markers)} pending uninstall(s)...", flush=True)
+    _log(f"\n[Nuvu Pre-Launch] Processing {len(markers)} pending uninstall(s)...")
     
-    pip_base, is_uv, is_standalone = _get_pip_base()
+    # Read every marker first so all packages go through one uninstall call
+    package_names = []
+    marker_paths = []
+    for marker in markers:
+        marker_paths.append(marker.path)
+        try:
+            with open(marker.path, 'r') as f:
+                # One package per line (prestartup_script writes multi-package markers)
+                names = f.read().split()
+        except Exception as e:
+            _log(f"[Nuvu Pre-Launch] Uninstall error: {e}")
+            continue
+        for package_name in names:
+            if package_name not in package_names:
+                _log(f"[Nuvu Pre-Launch] Uninstalling: {package_name}")
+                package_names.append(package_name)
     
-    for filename in markers:
-        marker_path = os.path.join(pending_dir, filename)
-        
+    if package_names:
+        pip_base, is_uv, is_standalone = _get_pip_base()
         try:
-            with open(marker_path, 'r') as f:
-                package_name = f.read().strip()
-            
-            if not package_name:
-                os.remove(marker_path)
-                continue
-            
-            print(f"[Nuvu Pre-Launch] Uninstalling: {package_name}", flush=True)
-            
-            if is_uv:
-                cmd = list(pip_base) + ['uninstall']
-                if is_standalone and _is_embedded_python():
-                    cmd.extend(['--python', sys.executable])
-                cmd.extend(['-y', package_name])
-            else:
-                cmd = list(pip_base) + ['uninstall', '-y', package_name]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode != 0:
+            cmd = _build_uninstall_cmd(pip_base, is_uv, is_standalone, package_names)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=120)
+            failed = result.returncode != 0
+        except Exception as e:
+            _log(f"[Nuvu Pre-Launch] Uninstall error: {e}")
+            failed = True
+        
+        if failed:
+            # The batch stops at the first broken package; clear whatever is
+            # left straight from site-packages (a no-op for removed packages)
+            for package_name in package_names:
                 force_delete_package(package_name)
-            
+    
+    for marker_path in marker_paths:
+        try:
             os.remove(marker_path)
-            
+        except Exception:
+            pass
+
+
+def _build_uninstall_cmd(pip_base, is_uv, is_standalone, package_names):
+    """Build an uninstall command for the given package names."""
+    if is_uv:
+        cmd = list(pip_base) + ['uninstall']
+        if is_standalone and _is_embedded_python():
+            cmd.extend(['--python', sys.executable])
+        cmd.extend(['-y'] + package_names)
+    else:
+        cmd = list(pip_base) + ['uninstall', '-y'] + package_names
+    return cmd
+
+
+def _build_install_cmd(pip_base, is_uv, is_standalone, spec_parts):
+    """Build an install command for the given spec_parts."""
+    # Filter out --force-reinstall for uv (use --reinstall instead)
+    if is_uv:
+        spec_parts = [p if p != '--force-reinstall' else '--reinstall' for p in spec_parts]
+        cmd = list(pip_base) + ['install']
+        if is_standalone and _is_embedded_python():
+            cmd.extend(['--python', sys.executable])
+        cmd.extend(spec_parts)
+    else:
+        cmd = list(pip_base) + ['install'] + spec_parts
+    return cmd
+
+
+def _uninstall_first(package_names, pip_base, is_uv, is_standalone, log=_log):
+    """Uninstall package_names ahead of a fresh install, force deleting them if that fails.
+    
+    Only the named packages are removed. --force-reinstall would instead
+    reinstall their whole dependency tree (e.g. every nvidia-* wheel for torch).
+    """
+    if not package_names:
+        return
+    log(f"[Nuvu Pre-Launch] Uninstalling first: {', '.join(package_names)}")
+    cmd = _build_uninstall_cmd(pip_base, is_uv, is_standalone, package_names)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
+    if result.returncode != 0:
+        for pkg in package_names:
+            force_delete_package(pkg)
+
+
+def _remove_marker(marker_path):
+    """Remove a marker file, ignoring errors."""
+    try:
+        os.remove(marker_path)
+    except Exception:
+        pass
+
+
+def _group_by_package_names(pending):
+    """Group pending markers so that markers sharing a package end up together.
+    
+    Different groups touch disjoint packages and can be installed independently.
+    """
+    groups = []  # [(package_names, entries)]
+    
+    for entry in pending:
+        names = {name.lower() for name in extract_package_names(entry[2])}
+        entries = [entry]
+        for group in [g for g in groups if g[0] & names]:
+            groups.remove(group)
+            names |= group[0]
+            entries = group[1] + entries
+        entries.sort(key=pending.index)
+        groups.append((names, entries))
+    
+    return [entries for _, entries in groups]
+
+
+def _install_marker_group(entries, pip_base, is_uv, is_standalone):
+    """Install a group of markers one after another.
+    
+    Output is collected and returned so concurrent groups don't interleave lines.
+    """
+    out = io.StringIO()
+    
+    for _, package_spec, spec_parts in entries:
+        cmd = _build_install_cmd(pip_base, is_uv, is_standalone, spec_parts)
+        try:
+            _uninstall_first(extract_package_names(spec_parts), pip_base, is_uv, is_standalone,
+                             lambda message: print(message, file=out))
+            print(f"[Nuvu Pre-Launch] Installing: {' '.join(cmd)}", file=out)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=600)
+            if result.returncode == 0:
+                print(f"[Nuvu Pre-Launch] Successfully installed {package_spec}", file=out)
+            else:
+                print(f"[Nuvu Pre-Launch] Failed: {result.stderr[:500]}", file=out)
+        except subprocess.TimeoutExpired:
+            print(f"[Nuvu Pre-Launch] Install timed out: {package_spec}", file=out)
         except Exception as e:
-            print(f"[Nuvu Pre-Launch] Uninstall error: {e}", flush=True)
-            try:
-                os.remove(marker_path)
-            except Exception:
-                pass
+            print(f"[Nuvu Pre-Launch] Install error: {e}", file=out)
+    
+    return out.getvalue()
+
+
+def load_pending_installs(pending_dir):
+    """Load pending install specs as an ordered {marker_id: spec} dict, read from the *.txt markers."""
+    index = {}
+    for marker in list_marker_files(pending_dir):
+        try:
+            with open(marker.path, 'r') as f:
+                index[marker.name[:-len('.txt')]] = f.read()
+        except Exception as e:
+            _log(f"[Nuvu Pre-Launch] Could not read {marker.name}: {e}")
+    return index
+
+
+def _retire_pending_installs(pending_dir, index):
+    """Remove the *.txt markers that were processed."""
+    for marker_id in index:
+        _remove_marker(os.path.join(pending_dir, marker_id + '.txt'))
 
 
 def run_pending_installs():
-    """Process pending install markers."""
+    """Process pending install markers.
+    
+    Markers that are plain package specs share one uninstall and one install
+    invocation, so pip/uv startup and resolver costs are paid once instead of
+    once per marker. Markers with flags (index URLs, --pre, ...) are installed
+    on their own so their flags don't leak onto other packages. If the batched
+    install fails, each marker is retried on its own, with markers that touch
+    different packages retried in parallel when uv is available.
+    """
     global _torch_index_url
     
     pending_dir = get_pending_installs_dir()
@@ -378,86 +648,91 @@ def run_pending_installs():
     if not os.path.isdir(pending_dir):
         return
     
-    markers = [f for f in os.listdir(pending_dir) if f.endswith('.txt')]
-    if not markers:
+    index = load_pending_installs(pending_dir)
+    if not index:
         return
     
-    print(f"\n[Nuvu Pre-Launch] Processing {len(markers)} pending install(s)...", flush=True)
+    _log(f"\n[Nuvu Pre-Launch] Processing {len(index)} pending install(s)...")
     
     pip_base, is_uv, is_standalone = _get_pip_base()
     
-    for filename in markers:
-        marker_path = os.path.join(pending_dir, filename)
-        
+    # Parse all markers first: (marker_id, package_spec, spec_parts)
+    pending = []
+    
+    for marker_id, package_spec in index.items():
         try:
-            with open(marker_path, 'r') as f:
-                package_spec = f.read().strip()
-            
-            if not package_spec:
-                os.remove(marker_path)
+            spec_parts, package_names, index_url = parse_pending_spec(package_spec)
+            if not spec_parts:
                 continue
             
-            print(f"[Nuvu Pre-Launch] Pending install: {package_spec}", flush=True)
-            
-            spec_parts = shlex.split(package_spec)
-            package_names = extract_package_names(spec_parts)
+            package_spec = shlex.join(spec_parts)
+            _log(f"[Nuvu Pre-Launch] Pending install: {package_spec}")
             
             # If this is a torch-related install, save the index URL for later use
             torch_packages = ['torch', 'torchvision', 'torchaudio']
             if any(pkg in torch_packages for pkg in package_names):
-                index_url = extract_index_url(spec_parts)
                 if index_url:
                     save_torch_index_url(index_url)
-                    print(f"[Nuvu Pre-Launch] Saved torch index URL: {index_url}", flush=True)
-            
-            # Uninstall first to ensure clean state
-            if package_names:
-                print(f"[Nuvu Pre-Launch] Uninstalling first: {', '.join(package_names)}", flush=True)
-                if is_uv:
-                    uninstall_cmd = list(pip_base) + ['uninstall']
-                    if is_standalone and _is_embedded_python():
-                        uninstall_cmd.extend(['--python', sys.executable])
-                    uninstall_cmd.extend(['-y'] + package_names)
-                else:
-                    uninstall_cmd = list(pip_base) + ['uninstall', '-y'] + package_names
-                uninstall_result = subprocess.run(uninstall_cmd, capture_output=True, text=True, timeout=120)
-                if uninstall_result.returncode != 0:
-                    for pkg in package_names:
-                        force_delete_package(pkg)
-            
-            # Install packages
-            # Filter out --force-reinstall for uv (use --reinstall instead)
-            if is_uv:
-                spec_parts = [p if p != '--force-reinstall' else '--reinstall' for p in spec_parts]
-                cmd = list(pip_base) + ['install']
-                if is_standalone and _is_embedded_python():
-                    cmd.extend(['--python', sys.executable])
-                cmd.extend(spec_parts)
-            else:
-                cmd = list(pip_base) + ['install'] + spec_parts
+                    _log(f"[Nuvu Pre-Launch] Saved torch index URL: {index_url}")
             
-            print(f"[Nuvu Pre-Launch] Installing: {' '.join(cmd)}", flush=True)
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            pending.append((marker_id, package_spec, spec_parts))
             
-            if result.returncode == 0:
-                print(f"[Nuvu Pre-Launch] Successfully installed {package_spec}", flush=True)
-            else:
-                print(f"[Nuvu Pre-Launch] Failed: {result.stderr[:500]}", flush=True)
-            
-            os.remove(marker_path)
-            
-        except subprocess.TimeoutExpired:
-            print(f"[Nuvu Pre-Launch] Install timed out", flush=True)
-            try:
-                os.remove(marker_path)
-            except Exception:
-                pass
         except Exception as e:
-            print(f"[Nuvu Pre-Launch] Install error: {e}", flush=True)
+            _log(f"[Nuvu Pre-Launch] Install error: {e}")
+    
+    if not pending:
+        _retire_pending_installs(pending_dir, index)
+        return
+    
+    try:
+        # Install the flag-free markers in one invocation. Only the marker
+        # packages are removed first, so their dependencies are left alone
+        # unless the new versions need something else.
+        plain = [entry for entry in pending if not any(part.startswith('-') for part in entry[2])]
+        if len(plain) > 1:
+            merged_parts = list(dict.fromkeys(part for _, _, spec_parts in plain for part in spec_parts))
+            _uninstall_first(extract_package_names(merged_parts), pip_base, is_uv, is_standalone)
+            cmd = _build_install_cmd(pip_base, is_uv, is_standalone, merged_parts)
+            _log(f"[Nuvu Pre-Launch] Installing: {' '.join(cmd)}")
             try:
-                os.remove(marker_path)
-            except Exception:
-                pass
+                # Allow as long as the markers would have had one by one
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                        timeout=600 * len(plain))
+                if result.returncode == 0:
+                    for _, package_spec, _ in plain:
+                        _log(f"[Nuvu Pre-Launch] Successfully installed {package_spec}")
+                    pending = [entry for entry in pending if entry not in plain]
+                else:
+                    _log(f"[Nuvu Pre-Launch] Failed: {result.stderr[:500]}")
+                    _log("[Nuvu Pre-Launch] Retrying each pending install separately")
+            except subprocess.TimeoutExpired:
+                # The packages were already uninstalled, so retry rather than lose them
+                _log("[Nuvu Pre-Launch] Batched install timed out, retrying each pending install separately")
+        
+        if pending:
+            groups = _group_by_package_names(pending)
+            if len(groups) > 1 and is_uv and not _is_embedded_python():
+                # Groups touch disjoint packages, so uv can install them concurrently
+                with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+                    futures = [
+                        executor.submit(_install_marker_group, group, pip_base, is_uv, is_standalone)
+                        for group in groups
+                    ]
+                    for future in futures:
+                        print(future.result(), end='', flush=True)
+            else:
+                # pip has no environment lock and concurrent runs can corrupt
+                # site-packages, as can embedded Python on Windows, so stay serial
+                for group in groups:
+                    print(_install_marker_group(group, pip_base, is_uv, is_standalone), end='', flush=True)
+    
+    except subprocess.TimeoutExpired:
+        _log(f"[Nuvu Pre-Launch] Install timed out")
+    except Exception as e:
+        _log(f"[Nuvu Pre-Launch] Install error: {e}")
+    
+    # Remove markers regardless of success (don't retry forever)
+    _retire_pending_installs(pending_dir, index)
 
 
 def cleanup_corrupted_packages():
@@ -465,106 +740,105 @@ def cleanup_corrupted_packages():
     
     These packages have broken metadata that prevents proper version comparison.
     Force deleting them allows a clean reinstall.
-    """
-    pip_base = [sys.executable]
-    if _is_embedded_python():
-        pip_base.append('-s')
-    pip_base.extend(['-m', 'pip'])
     
+    Uses a single importlib.metadata scan instead of running `pip list` twice.
+    """
     try:
-        # Run pip list to get all packages
-        cmd = list(pip_base) + ['list', '--format=freeze']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode != 0:
-            return
-        
         corrupted = []
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # Format is "package==version" or just "package" if version is missing
-            if '==' in line:
-                pkg, version = line.split('==', 1)
-                if version.lower() == 'none' or not version:
-                    corrupted.append(pkg)
-            elif '==' not in line and '@' not in line:
-                # Package with no version at all
-                corrupted.append(line)
-        
-        # Also check regular pip list format for "None" versions
-        cmd2 = list(pip_base) + ['list']
-        result2 = subprocess.run(cmd2, capture_output=True, text=True, timeout=30)
-        if result2.returncode == 0:
-            for line in result2.stdout.splitlines():
-                parts = line.split()
-                if len(parts) >= 2 and parts[1].lower() == 'none':
-                    pkg = parts[0]
-                    if pkg not in corrupted:
-                        corrupted.append(pkg)
+        for dist in _im.distributions():
+            try:
+                name = dist.metadata['Name']
+                version = dist.version
+            except Exception:
+                # METADATA itself is unreadable - fall back to the dist-info directory name
+                name = None
+                version = None
+            
+            if not name:
+                path = getattr(dist, '_path', None)
+                if path is None:
+                    continue
+                name = Path(path).name.split('-', 1)[0]
+            
+            if not version or str(version).lower() == 'none':
+                if name not in corrupted:
+                    corrupted.append(name)
         
         if corrupted:
-            print(f"[Nuvu Pre-Launch] Found {len(corrupted)} corrupted package(s): {', '.join(corrupted)}", flush=True)
+            _log(f"[Nuvu Pre-Launch] Found {len(corrupted)} corrupted package(s): {', '.join(corrupted)}")
             for pkg in corrupted:
-                print(f"[Nuvu Pre-Launch] Force deleting corrupted: {pkg}", flush=True)
+                _log(f"[Nuvu Pre-Launch] Force deleting corrupted: {pkg}")
                 force_delete_package(pkg)
     
     except Exception as e:
-        print(f"[Nuvu Pre-Launch] Error checking for corrupted packages: {e}", flush=True)
+        _log(f"[Nuvu Pre-Launch] Error checking for corrupted packages: {e}")
 
 
 def install_critical_packages():
-    """Force reinstall critical packages that may be broken."""
+    """Reinstall critical packages that are missing, broken or at the wrong version.
+    
+    Nothing is run when every critical package is already installed and satisfies
+    its spec.
+    """
     # First, clean up any packages with corrupted metadata (version = None)
     cleanup_corrupted_packages()
     
-    pip_base, is_uv, is_standalone = _get_pip_base()
-    
-    # Force reinstall packages that commonly get corrupted metadata after PyTorch upgrades
+    # Reinstall packages that commonly get corrupted metadata after PyTorch upgrades
     # - pillow: Image processing, breaks ComfyUI startup if corrupted
     # - transformers: HuggingFace, version comparison fails if numpy metadata is broken
     # - numpy: Core dependency, metadata often corrupted during torch upgrades
     # - huggingface_hub: Must be <1.0, higher versions break some ComfyUI workflows
-    print("[Nuvu Pre-Launch] Ensuring critical packages...", flush=True)
+    _log("[Nuvu Pre-Launch] Ensuring critical packages...")
     
     critical_packages = ['pillow', 'numpy', 'transformers==4.57.6', 'huggingface_hub<1.0', 'diffusers>=0.33.0']
     
-    if is_uv:
-        cmd = list(pip_base) + ['install']
-        if is_standalone and _is_embedded_python():
-            cmd.extend(['--python', sys.executable])
-        cmd.extend(['--reinstall'] + critical_packages + ['-q'])
-    else:
-        cmd = list(pip_base) + ['install', '--force-reinstall'] + critical_packages + ['-q']
+    # Look up just the critical packages' versions (cheaper than a full distributions scan)
+    parsed = [parse_requirement(spec) for spec in critical_packages]
+    installed_versions = [(pkg_name, get_installed_version(pkg_name)) for pkg_name, _ in parsed]
     
-    print(f"[Nuvu Pre-Launch] Running: {' '.join(cmd)}", flush=True)
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-    if result.returncode != 0:
-        print(f"[Nuvu Pre-Launch] Critical packages install issue: {result.stderr[:200]}", flush=True)
+    needed = []
+    for spec, (_, version_spec), (_, installed) in zip(critical_packages, parsed, installed_versions):
+        if installed is None or not version_satisfies(installed, version_spec):
+            needed.append(spec)
+    
+    if needed:
+        pip_base, is_uv, is_standalone = _get_pip_base()
+        
+        if is_uv:
+            cmd = list(pip_base) + ['install']
+            if is_standalone and _is_embedded_python():
+                cmd.extend(['--python', sys.executable])
+            cmd.extend(['--reinstall'] + needed + ['-q'])
+        else:
+            cmd = list(pip_base) + ['install', '--force-reinstall'] + needed + ['-q']
+        
+        _log(f"[Nuvu Pre-Launch] Running: {' '.join(cmd)}")
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=300)
+        if result.returncode != 0:
+            _log(f"[Nuvu Pre-Launch] Critical packages install issue: {result.stderr[:200]}")
+    else:
+        _log("[Nuvu Pre-Launch] Critical packages OK")
 
 
+@functools.lru_cache(maxsize=512)
 def parse_requirement(req_line):
     """Parse a requirement line into (package_name, version_spec) or None if invalid."""
-    import re
-    
     req_line = req_line.strip()
     
-    # Skip comments and empty lines
-    if not req_line or req_line.startswith('#'):
+    # Skip comments, empty lines and options (-r, --index-url, ...)
+    if not req_line or _COMMENT_OR_OPTION.match(req_line):
         return None
     
-    # Skip lines with URLs or options
-    if req_line.startswith('-') or '://' in req_line:
+    # Skip lines with URLs
+    if '://' in req_line:
         return None
     
     # Handle environment markers (e.g., "package; platform_system == 'Windows'")
-    if ';' in req_line:
-        req_line = req_line.split(';')[0].strip()
+    req_line = req_line.partition(';')[0].strip()
     
     # Extract package name and version spec
     # Patterns: package>=1.0, package==1.0, package<2.0, package[extra]>=1.0
-    match = re.match(r'^([a-zA-Z0-9_-]+)(\[[^\]]+\])?(.*)$', req_line)
+    match = _REQ_RE.match(req_line)
     if match:
         pkg_name = match.group(1)
         version_spec = match.group(3).strip() if match.group(3) else ''
@@ -576,28 +850,54 @@ def parse_requirement(req_line):
 def get_installed_version(pip_name):
     """Get the installed version of a package using importlib.metadata."""
     try:
-        import importlib.metadata
-        return importlib.metadata.version(pip_name)
+        return _im.version(pip_name)
     except Exception:
         return None
 
 
+def get_installed_versions():
+    """Get {canonical_name: version} for every installed distribution.
+    
+    One importlib.metadata.distributions() scan replaces a separate
+    sys.path walk per package. The first distribution found on sys.path
+    wins, matching what importlib.metadata.version() would return.
+    """
+    installed = {}
+    for dist in _im.distributions():
+        try:
+            name = dist.metadata['Name']
+        except Exception:
+            continue
+        if name:
+            installed.setdefault(canonicalize_name(name), dist.version)
+    return installed
+
+
+@functools.lru_cache(maxsize=512)
+def _spec(version_spec):
+    """Parse a version specifier string into a cached SpecifierSet."""
+    from packaging.specifiers import SpecifierSet
+    return SpecifierSet(version_spec)
+
+
 def version_satisfies(installed_version, version_spec):
-    """Check if installed version satisfies the version specification."""
+    """Check if installed version satisfies the version specification.
+    
+    Uses packaging so pre-releases, post-releases and local versions
+    (e.g. '2.4.0+cu121') compare correctly.
+    """
+    global _pkg_version
+    
     if not version_spec or not installed_version:
         return installed_version is not None  # If no spec, just check if installed
     
     try:
-        from packaging import version as pkg_version
-        from packaging.specifiers import SpecifierSet
+        if _pkg_version is None:
+            from packaging import version as _pkg_version
         
-        installed = pkg_version.parse(installed_version)
-        specifier = SpecifierSet(version_spec)
-        return installed in specifier
+        return _pkg_version.parse(installed_version) in _spec(version_spec)
     except Exception:
         # If packaging isn't available, try a basic check
-        import re
-        
         # Handle simple cases: ==, >=, <=, >, <
         match = re.match(r'^([<>=!]+)(.+)$', version_spec)
         if not match:
@@ -633,6 +933,29 @@ def version_satisfies(installed_version, version_spec):
         return True  # Can't compare, assume OK
 
 
+def get_requirements_cache_file():
+    return os.path.join(get_nuvu_dir(), 'req_cache.json')
+
+
+def _requirements_cache_key(requirements_path):
+    """Key the verification verdict on the requirements file, the target Python
+    and the state of site-packages.
+    
+    Installing, upgrading or removing a package adds or renames a top-level
+    entry in site-packages, which bumps the directory's mtime. Pending installs
+    earlier in this launch, or changes made outside Nuvu, therefore invalidate
+    the cached verdict.
+    """
+    st = os.stat(requirements_path)
+    parts = [f"{st.st_mtime_ns}:{st.st_size}:{sys.version}:{sys.executable}"]
+    for sp_dir in _site_packages_dirs():
+        try:
+            parts.append(f"{sp_dir}:{os.stat(sp_dir).st_mtime_ns}")
+        except OSError:
+            pass
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
 def verify_and_install_requirements():
     """Verify ComfyUI requirements.txt packages are installed with correct versions.
     
@@ -640,11 +963,13 @@ def verify_and_install_requirements():
     1. It checks actual installed versions against requirements
     2. It reports which packages are missing or have wrong versions
     3. It only installs/upgrades what's actually needed
+    
+    A satisfied result is cached in .nuvu/req_cache.json keyed on the file's
+    mtime/size, the Python interpreter and the site-packages mtimes; set
+    NUVU_NO_REQ_CACHE to bypass it.
     """
     global _torch_index_url
     
-    pip_base, is_uv, is_standalone = _get_pip_base()
-    
     # Find ComfyUI requirements.txt
     script_dir = os.path.dirname(os.path.abspath(__file__))
     custom_nodes_dir = os.path.dirname(script_dir)
@@ -652,12 +977,32 @@ def verify_and_install_requirements():
     requirements_path = os.path.join(comfyui_dir, 'requirements.txt')
     
     if not os.path.isfile(requirements_path):
-        print("[Nuvu Pre-Launch] No requirements.txt found", flush=True)
+        _log("[Nuvu Pre-Launch] No requirements.txt found")
         return
     
-    print("[Nuvu Pre-Launch] Verifying ComfyUI requirements...", flush=True)
+    # Skip verification entirely if this exact requirements.txt was already satisfied
+    cache_file = get_requirements_cache_file()
+    cache_key = _requirements_cache_key(requirements_path)
+    if not os.environ.get('NUVU_NO_REQ_CACHE'):
+        try:
+            with open(cache_file, 'r') as f:
+                data = json.load(f)
+            if data.get('key') == cache_key and data.get('ok') is True:
+                _log("[Nuvu Pre-Launch] Requirements verified (cached)")
+                return
+        except Exception:
+            pass
+    
+    _log("[Nuvu Pre-Launch] Verifying ComfyUI requirements...")
+    
+    # Scan installed distributions once instead of once per requirement
+    try:
+        installed_versions = get_installed_versions()
+    except Exception:
+        installed_versions = {}
     
     # Parse requirements file
+    parsed_ok = True
     missing_packages = []
     wrong_version_packages = []
     
@@ -669,17 +1014,18 @@ def verify_and_install_requirements():
                     continue
                 
                 pkg_name, version_spec = req
-                installed = get_installed_version(pkg_name)
+                installed = installed_versions.get(canonicalize_name(pkg_name))
                 
                 if installed is None:
                     missing_packages.append(f"{pkg_name}{version_spec}")
-                    print(f"[Nuvu Pre-Launch] Missing: {pkg_name}", flush=True)
+                    _log(f"[Nuvu Pre-Launch] Missing: {pkg_name}")
                 elif version_spec and not version_satisfies(installed, version_spec):
                     wrong_version_packages.append(f"{pkg_name}{version_spec}")
-                    print(f"[Nuvu Pre-Launch] Version mismatch: {pkg_name} (installed={installed}, required={version_spec})", flush=True)
+                    _log(f"[Nuvu Pre-Launch] Version mismatch: {pkg_name} (installed={installed}, required={version_spec})")
     except Exception as e:
-        print(f"[Nuvu Pre-Launch] Error parsing requirements: {e}", flush=True)
+        _log(f"[Nuvu Pre-Launch] Error parsing requirements: {e}")
         # Fall back to just running pip install
+        parsed_ok = False
         missing_packages = []
         wrong_version_packages = []
     
@@ -687,8 +1033,9 @@ def verify_and_install_requirements():
     packages_to_install = missing_packages + wrong_version_packages
     
     if packages_to_install:
-        print(f"[Nuvu Pre-Launch] Installing {len(packages_to_install)} package(s)...", flush=True)
+        _log(f"[Nuvu Pre-Launch] Installing {len(packages_to_install)} package(s)...")
         
+        pip_base, is_uv, is_standalone = _get_pip_base()
         if is_uv:
             cmd = list(pip_base) + ['install']
             if is_standalone and _is_embedded_python():
@@ -700,15 +1047,22 @@ def verify_and_install_requirements():
         # Add torch index URL if available
         if _torch_index_url:
             cmd.extend(['--extra-index-url', _torch_index_url])
-            print(f"[Nuvu Pre-Launch] Using torch index: {_torch_index_url}", flush=True)
+            _log(f"[Nuvu Pre-Launch] Using torch index: {_torch_index_url}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=600)
         if result.returncode != 0:
-            print(f"[Nuvu Pre-Launch] Install error: {result.stderr[:500]}", flush=True)
+            _log(f"[Nuvu Pre-Launch] Install error: {result.stderr[:500]}")
         else:
-            print(f"[Nuvu Pre-Launch] Requirements verified and installed", flush=True)
+            _log(f"[Nuvu Pre-Launch] Requirements verified and installed")
     else:
-        print("[Nuvu Pre-Launch] All requirements satisfied", flush=True)
+        _log("[Nuvu Pre-Launch] All requirements satisfied")
+        if parsed_ok:
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(cache_file, 'w') as f:
+                    json.dump({'key': cache_key, 'ok': True}, f)
+            except Exception:
+                pass
 
 
 def install_comfyui_requirements():
@@ -736,7 +1090,7 @@ def main():
         install_comfyui_requirements()
         
     except Exception as e:
-        print(f"[Nuvu Pre-Launch] Error: {e}", flush=True)
+        _log(f"[Nuvu Pre-Launch] Error: {e}")
 
 
 if __name__ == '__main__':
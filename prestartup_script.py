@@ -9,13 +9,19 @@ It handles:
 IMPORTANT: This script must NOT import from comfyui_nuvu to avoid locking .pyd files.
 """
 
+import importlib
+import io
 import os
+import re
+import hashlib
 import sys
 import subprocess
+import threading
+import time
 import shutil
-import platform
+import stat
 import logging
-import filecmp
+import functools
 
 # =============================================================================
 # CRITICAL: Ensure user site-packages is disabled for portable/embedded Python
@@ -25,124 +31,268 @@ import filecmp
 # used even after os.execv() restarts (which ComfyUI-Manager uses).
 # Without this, conflicting package versions in user site-packages can break
 # ComfyUI (e.g., huggingface_hub>=1.0 in user site-packages when <1.0 is required).
-if "python_embeded" in sys.executable.lower():
+_IS_EMBEDDED = "python_embeded" in sys.executable.lower()
+
+if _IS_EMBEDDED:
     os.environ['PYTHONNOUSERSITE'] = '1'
 
-logger = logging.getLogger("ComfyUI-Nuvu")
+# uv unpacks one wheel per CPU by default, which thrashes the disk on big boxes
+# (and NTFS handles many small files poorly). Cap it unless the user chose a value;
+# uv subprocesses inherit this.
+os.environ.setdefault('UV_CONCURRENT_INSTALLS', str(min(os.cpu_count() or 4, 16 if os.name == 'nt' else 32)))
+
+# Base pip command for this interpreter (-s keeps user site-packages out on embedded Python)
+_PIP_BASE = (sys.executable, '-s', '-m', 'pip') if _IS_EMBEDDED else (sys.executable, '-m', 'pip')
+# Prefixes for the pip subcommands we run; installs skip pip's PyPI self-update check
+_PIP_INSTALL = (*_PIP_BASE, 'install', '--disable-pip-version-check')
+_PIP_UNINSTALL = (*_PIP_BASE, 'uninstall', '-y')
+
+# Created on first use - the fast path (uv present, nothing pending) never logs
+logger = None
+
+
+def _get_logger():
+    """Return the ComfyUI-Nuvu logger, creating it on first use."""
+    global logger
+    if logger is None:
+        logger = logging.getLogger("ComfyUI-Nuvu")
+    return logger
+
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Sentinel recording where uv was installed, so later launches skip the uv path probes
+_UV_SENTINEL = os.path.join(_script_dir, '.nuvu', 'uv_installed_v1')
+
+
+def _load_uv_sentinel():
+    """Read the installed uv path from the sentinel file, or None."""
+    try:
+        with open(_UV_SENTINEL, 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+_cached_uv_path = _load_uv_sentinel()
+
 
 # =============================================================================
 # Requirements Tracking (inline to avoid importing comfyui_nuvu)
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
+def _site_packages_dirs():
+    """Existing site-packages directories (global and user), looked up once per process."""
+    import site
+    
+    dirs = list(site.getsitepackages())
+    user_site = site.getusersitepackages()
+    if user_site:
+        dirs.append(user_site)
+    return tuple(d for d in dirs if os.path.isdir(d))
+
+
+# Locked-file retry budget, mirrors pre_launch._rmtree
+_LOCKED_FILE_DEADLINE = 0.5
+_LOCKED_TREE_BUDGET = 1.5
+
+
+def _chmod_and_retry(func, path, _exc, budget_deadline=None):
+    """rmtree error handler: clear the read-only bit and retry (mirrors pre_launch._chmod_and_retry)."""
+    try:
+        os.chmod(path, stat.S_IWRITE)
+    except OSError:
+        pass
+    deadline = time.monotonic() + _LOCKED_FILE_DEADLINE
+    if budget_deadline is not None:
+        deadline = min(deadline, budget_deadline)
+    delay = 0.001
+    while True:
+        try:
+            func(path)
+            return
+        except PermissionError:
+            if os.name != 'nt' or time.monotonic() + delay > deadline:
+                return
+        except Exception:
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 0.25)
+
+
+def _rmtree(path):
+    """Remove a directory tree, retrying read-only files instead of leaving them behind."""
+    handler = functools.partial(_chmod_and_retry, budget_deadline=time.monotonic() + _LOCKED_TREE_BUDGET)
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=handler)
+    else:
+        shutil.rmtree(path, onerror=handler)
+
+
+_NUVU_DIST_INFO_RE = re.compile(r'^comfyui[-_]nuvu-.+\.dist[-_]info$', re.IGNORECASE)
+
+
 def _cleanup_orphaned_dist_info():
     """
     Clean up orphaned comfyui_nuvu .dist-info directories.
     
     These can accumulate when installations are interrupted or when uv/pip
-    fails to uninstall old versions due to missing RECORD files.
+    fails to uninstall old versions due to missing RECORD files. A scan that
+    found nothing to clean is remembered until site-packages changes.
     """
+    # Taken before scanning, so anything installed meanwhile forces a rescan
+    clean_file = os.path.join(_script_dir, '.nuvu', 'dist_info.clean')
+    clean_key = None
     try:
-        # Find site-packages directory
-        import site
-        site_packages = None
-        
-        # Try to find the site-packages containing comfyui_nuvu
-        for sp in site.getsitepackages() + [site.getusersitepackages()]:
-            if sp and os.path.isdir(sp):
-                # Check if this site-packages has any comfyui_nuvu dist-info
-                for item in os.listdir(sp):
-                    if item.startswith('comfyui_nuvu-') and item.endswith('.dist-info'):
-                        site_packages = sp
-                        break
-            if site_packages:
-                break
-        
-        if not site_packages:
-            return
-        
-        # Find all comfyui_nuvu dist-info directories
+        clean_key = _environment_key(b'dist-info')
+        with open(clean_file, 'r') as f:
+            if f.read().strip() == clean_key:
+                return
+    except OSError:
+        pass
+    
+    try:
+        # Find the site-packages containing comfyui_nuvu, collecting its
+        # dist-info directories in the same scandir pass
         dist_infos = []
-        for item in os.listdir(site_packages):
-            if item.startswith('comfyui_nuvu-') and item.endswith('.dist-info'):
-                dist_infos.append(item)
-        
-        if len(dist_infos) <= 1:
-            # Nothing to clean up
-            return
+        for sp in _site_packages_dirs():
+            with os.scandir(sp) as it:
+                dist_infos = [
+                    entry for entry in it
+                    if _NUVU_DIST_INFO_RE.match(entry.name) and entry.is_dir(follow_symlinks=False)
+                ]
+            if dist_infos:
+                break
         
         # Find which ones are orphaned (missing RECORD file)
         orphaned = []
-        valid = []
-        for dist_info in dist_infos:
-            dist_info_path = os.path.join(site_packages, dist_info)
-            record_path = os.path.join(dist_info_path, 'RECORD')
-            if os.path.isfile(record_path):
-                valid.append(dist_info)
-            else:
-                orphaned.append(dist_info)
+        if len(dist_infos) > 1:
+            orphaned = [
+                entry for entry in dist_infos
+                if not os.path.isfile(os.path.join(entry.path, 'RECORD'))
+            ]
         
         if not orphaned:
+            # Nothing to clean up
+            if clean_key is not None:
+                _write_text_atomic(clean_file, clean_key)
             return
         
-        logger.info(f"[ComfyUI-Nuvu] Cleaning up {len(orphaned)} orphaned dist-info directories")
+        _get_logger().info("[ComfyUI-Nuvu] Cleaning up %s orphaned dist-info directories", len(orphaned))
         
-        for dist_info in orphaned:
-            dist_info_path = os.path.join(site_packages, dist_info)
+        for entry in orphaned:
             try:
-                shutil.rmtree(dist_info_path)
-                logger.debug(f"[ComfyUI-Nuvu] Removed orphaned: {dist_info}")
+                _rmtree(entry.path)
+                _get_logger().debug("[ComfyUI-Nuvu] Removed orphaned: %s", entry.name)
             except Exception as e:
-                logger.debug(f"[ComfyUI-Nuvu] Could not remove {dist_info}: {e}")
+                _get_logger().debug("[ComfyUI-Nuvu] Could not remove %s: %s", entry.name, e)
     
     except Exception as e:
         # Non-fatal - don't break startup for cleanup issues
-        logger.debug(f"[ComfyUI-Nuvu] Dist-info cleanup skipped: {e}")
+        _get_logger().debug("[ComfyUI-Nuvu] Dist-info cleanup skipped: %s", e)
+
+
+# Startup probes the same .nuvu paths many times in one pass. Cache the results;
+# anything that creates or removes one of these paths calls _invalidate_path_cache().
+@functools.lru_cache(maxsize=512)
+def _cached_isfile(path):
+    return os.path.isfile(path)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_isdir(path):
+    return os.path.isdir(path)
+
+
+def _invalidate_path_cache():
+    """Forget cached isfile/isdir results after mutating the filesystem."""
+    _cached_isfile.cache_clear()
+    _cached_isdir.cache_clear()
+
+
+def _ensure_dir(path):
+    """Create path if needed, skipping the mkdir syscall once it's known to exist."""
+    if not _cached_isdir(path):
+        os.makedirs(path, exist_ok=True)
+        _invalidate_path_cache()
+    return path
+
+
+def _write_text_atomic(path, text):
+    """Write text to a sibling temp file and rename it over path.
+    
+    Readers never see a partially written file. The parent directory is only
+    created if the first open fails, so the steady state costs no mkdir.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        f = open(tmp_path, 'w')
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _invalidate_path_cache()
+        f = open(tmp_path, 'w')
+    with f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    _invalidate_path_cache()
 
 
 def _get_requirements_cache_path(repo_path):
-    """Get the path to the cached requirements file for a repo"""
-    nuvu_dir = os.path.join(repo_path, '.nuvu')
-    os.makedirs(nuvu_dir, exist_ok=True)
-    return os.path.join(nuvu_dir, 'installed_requirements.txt')
+    """Get the path to the cached requirements hash file for a repo.
+    
+    The .nuvu directory isn't created here; _write_text_atomic creates it
+    when the hash is first written, so checks never touch the repo.
+    """
+    return os.path.join(repo_path, '.nuvu', 'installed_requirements.hash')
+
+
+def _get_legacy_requirements_cache_path(repo_path):
+    """Get the path to the old full-copy requirements cache (pre-hash)."""
+    return os.path.join(repo_path, '.nuvu', 'installed_requirements.txt')
 
 
 def _get_torch_index_file():
     """Get the path to the torch index URL file."""
     comfyui_root = _detect_comfyui_root() or os.path.dirname(os.path.dirname(_script_dir))
-    nuvu_dir = os.path.join(comfyui_root, '.nuvu')
-    os.makedirs(nuvu_dir, exist_ok=True)
-    return os.path.join(nuvu_dir, 'torch_index_url.txt')
+    return os.path.join(comfyui_root, '.nuvu', 'torch_index_url.txt')
+
+
+# Saved torch index URL, read once per process (None once known to be unset)
+_NOT_LOADED = object()
+_torch_index_url = _NOT_LOADED
 
 
 def get_torch_index_url():
     """Load saved torch index URL from file."""
+    global _torch_index_url
+    if _torch_index_url is not _NOT_LOADED:
+        return _torch_index_url
+    
+    url = None
     index_file = _get_torch_index_file()
-    if os.path.isfile(index_file):
+    if _cached_isfile(index_file):
         try:
             with open(index_file, 'r') as f:
-                url = f.read().strip()
-                if url:
-                    return url
+                url = f.read().strip() or None
         except Exception:
             pass
-    return None
+    _torch_index_url = url
+    return url
 
 
 def save_torch_index_url(url):
     """Save torch index URL to file for future use."""
+    global _torch_index_url
     if not url:
         return
     index_file = _get_torch_index_file()
     try:
-        os.makedirs(os.path.dirname(index_file), exist_ok=True)
-        with open(index_file, 'w') as f:
-            f.write(url)
-        logger.info(f"[ComfyUI-Nuvu] Saved torch index URL: {url}")
+        _write_text_atomic(index_file, url)
+        _torch_index_url = url
+        _get_logger().info("[ComfyUI-Nuvu] Saved torch index URL: %s", url)
     except Exception as e:
-        logger.debug(f"[ComfyUI-Nuvu] Could not save torch index URL: {e}")
+        _get_logger().debug("[ComfyUI-Nuvu] Could not save torch index URL: %s", e)
 
 
 def _detect_and_save_torch_index():
@@ -171,41 +321,119 @@ def _detect_and_save_torch_index():
                 cuda_label = f"cu{cuda_parts[0]}{cuda_parts[1]}"
                 index_url = f"https://download.pytorch.org/whl/{cuda_label}"
                 save_torch_index_url(index_url)
-                logger.debug(f"[ComfyUI-Nuvu] Detected PyTorch CUDA {cuda_version}, saved index URL")
+                _get_logger().debug("[ComfyUI-Nuvu] Detected PyTorch CUDA %s, saved index URL", cuda_version)
     except ImportError:
         # PyTorch not installed yet
         pass
     except Exception as e:
-        logger.debug(f"[ComfyUI-Nuvu] Could not detect PyTorch CUDA version: {e}")
+        _get_logger().debug("[ComfyUI-Nuvu] Could not detect PyTorch CUDA version: %s", e)
+
+
+def _hash_file(path, algorithm=None):
+    """Hash a file as '<algorithm>:<hexdigest>'.
+    
+    Uses BLAKE3 when the blake3 package is installed, otherwise SHA-256.
+    Pass algorithm to reproduce a previously stored hash.
+    """
+    if algorithm in (None, 'blake3'):
+        try:
+            from blake3 import blake3 as hasher
+            algorithm = 'blake3'
+        except ImportError:
+            if algorithm == 'blake3':
+                return None
+            hasher, algorithm = hashlib.sha256, 'sha256'
+    else:
+        hasher = getattr(hashlib, algorithm)
+    
+    with open(path, 'rb') as f:
+        return f"{algorithm}:{hasher(f.read()).hexdigest()}"
+
+
+def _stat_key(path, st=None):
+    """Size and mtime of a file, used to skip hashing when it hasn't been touched.
+    
+    st may be an os.stat result the caller already has for path.
+    """
+    if st is None:
+        st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
 
+@functools.lru_cache(maxsize=1)
+def _interpreter_key():
+    """Identify the Python environment requirements were installed into."""
+    return f"{sys.version_info[0]}.{sys.version_info[1]}:{sys.executable}"
 
-def _files_equal(file1, file2):
-    """Check if two files are equal"""
+
+def _read_requirements_hash(cache_path):
+    """Read the stored (hash, stat key, interpreter key) triple; any may be None."""
     try:
-        return filecmp.cmp(file1, file2, shallow=False)
-    except Exception:
-        return False
+        with open(cache_path, 'r') as f:
+            lines = [line.strip() for line in f.read().splitlines()]
+    except OSError:
+        return None, None, None
+    lines += [None] * (3 - len(lines))
+    return lines[0] or None, lines[1] or None, lines[2] or None
+
+
+def _write_requirements_hash(cache_path, digest, stat_key):
+    """Store the requirements hash, the stat key it was computed for and the interpreter."""
+    _write_text_atomic(cache_path, f"{digest}\n{stat_key}\n{_interpreter_key()}\n")
 
 
-def _requirements_need_install(repo_path, requirements_filename='requirements.txt'):
+def _requirements_need_install(repo_path, requirements_filename='requirements.txt', st=None):
     """
-    Check if requirements need to be installed by comparing with cached version.
+    Check if requirements need to be installed by comparing with cached hash.
     Returns True if requirements have changed or cache doesn't exist.
     """
     requirements_path = os.path.join(repo_path, requirements_filename)
     cache_path = _get_requirements_cache_path(repo_path)
     
-    if not os.path.exists(requirements_path):
+    try:
+        stat_key = _stat_key(requirements_path, st)
+    except OSError:
+        return False
+    
+    stored, stored_stat_key, stored_interpreter = _read_requirements_hash(cache_path)
+    if stored is None:
+        # Fall back to the old full-copy cache, converting it to a hash on a match
+        import filecmp
+        
+        legacy_path = _get_legacy_requirements_cache_path(repo_path)
+        try:
+            if not filecmp.cmp(requirements_path, legacy_path, shallow=False):
+                return True
+        except OSError:
+            return True
+        _mark_requirements_installed(repo_path, requirements_filename)
         return False
     
-    if not os.path.exists(cache_path):
+    # A different Python (new venv, upgraded embedded build) needs its own install.
+    # Hashes written before the interpreter was recorded are taken as matching.
+    if stored_interpreter is not None and stored_interpreter != _interpreter_key():
         return True
     
-    return not _files_equal(requirements_path, cache_path)
+    # Fast path: same size and mtime as when we last hashed it
+    if stat_key == stored_stat_key:
+        return False
+    
+    # A different size means different content - no need to hash to find out
+    if stored_stat_key and stat_key.split(':', 1)[0] != stored_stat_key.split(':', 1)[0]:
+        return True
+    
+    try:
+        if _hash_file(requirements_path, stored.split(':', 1)[0]) != stored:
+            return True
+        # Touched but unchanged (e.g. git checkout) - refresh the stat key
+        _write_requirements_hash(cache_path, stored, stat_key)
+        return False
+    except Exception:
+        return True
 
 
 def _mark_requirements_installed(repo_path, requirements_filename='requirements.txt'):
-    """Mark requirements as successfully installed by copying to cache."""
+    """Mark requirements as successfully installed by caching their hash."""
     requirements_path = os.path.join(repo_path, requirements_filename)
     cache_path = _get_requirements_cache_path(repo_path)
     
@@ -213,13 +441,19 @@ def _mark_requirements_installed(repo_path, requirements_filename='requirements.
         return False
     
     try:
-        shutil.copy(requirements_path, cache_path)
+        stat_key = _stat_key(requirements_path)
+        _write_requirements_hash(cache_path, _hash_file(requirements_path), stat_key)
+        try:
+            os.remove(_get_legacy_requirements_cache_path(repo_path))
+        except FileNotFoundError:
+            pass
         return True
     except Exception as e:
-        logger.warning(f"[ComfyUI-Nuvu] Failed to cache requirements: {e}")
+        _get_logger().warning("[ComfyUI-Nuvu] Failed to cache requirements: %s", e)
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_comfyui_root():
     """Detect the ComfyUI root directory."""
     # Walk up from script directory to find ComfyUI root
@@ -238,9 +472,9 @@ def _detect_comfyui_root():
     return None
 
 
-def _get_uv_paths():
-    """Get platform-specific uv paths."""
-    if platform.system() == "Windows":
+def _compute_uv_paths():
+    """Compute platform-specific uv paths."""
+    if sys.platform == "win32":
         local_app_data = os.environ.get("LOCALAPPDATA")
         if local_app_data:
             uv_dir = os.path.join(local_app_data, "nuvu", "bin")
@@ -256,110 +490,647 @@ def _get_uv_paths():
     return uv_dir, uv_exe, download_url
 
 
+# The uv paths only depend on the environment, so resolve them once at import
+_UV_DIR, _UV_EXE, _DOWNLOAD_URL = _compute_uv_paths()
+
+
+def _get_uv_paths():
+    """Get platform-specific uv paths."""
+    return _UV_DIR, _UV_EXE, _DOWNLOAD_URL
+
+
+# Set once the background uv install has finished (successfully or not)
+_uv_ready = threading.Event()
+_UV_READY_TIMEOUT = 300
+
+
+def _is_uv_binary(path):
+    """Check that path is a non-empty file (rejects zero-byte leftovers of a failed write)."""
+    try:
+        return os.path.isfile(path) and os.path.getsize(path) > 0
+    except OSError:
+        return False
+
+
+_found_uv = _NOT_LOADED
+
+
 def _find_uv():
-    """Find uv executable without importing from comfyui_nuvu."""
-    uv_dir, uv_exe, _ = _get_uv_paths()
-    if os.path.isfile(uv_exe):
-        return uv_exe
-    return shutil.which("uv")
+    """Find uv executable without importing from comfyui_nuvu.
+    
+    The result is remembered once the install thread has finished, so later
+    callers skip the stat and PATH walk.
+    """
+    global _found_uv
+    if _found_uv is not _NOT_LOADED:
+        return _found_uv
+    # uv may still be downloading on the install thread
+    ready = _uv_ready.wait(timeout=_UV_READY_TIMEOUT)
+    if _is_uv_binary(_UV_EXE):
+        uv_path = _UV_EXE
+    else:
+        # uv is gone, so the sentinel is stale - drop it so the next launch reinstalls
+        _clear_uv_sentinel()
+        uv_path = shutil.which("uv")
+    if ready:
+        _found_uv = uv_path
+    return uv_path
+
+
+def _write_uv_sentinel(uv_exe):
+    """Record the installed uv path so the next launch can skip probing for it."""
+    global _cached_uv_path
+    _cached_uv_path = uv_exe
+    try:
+        _write_text_atomic(_UV_SENTINEL, uv_exe)
+    except Exception as e:
+        _get_logger().debug("[ComfyUI-Nuvu] Could not write uv sentinel: %s", e)
+
+
+def _clear_uv_sentinel():
+    """Forget the recorded uv path."""
+    global _cached_uv_path
+    if _cached_uv_path is None:
+        return
+    _cached_uv_path = None
+    try:
+        os.remove(_UV_SENTINEL)
+    except OSError:
+        pass
+
+
+def _download_to_memory(url):
+    """Download url into a BytesIO, copying in large chunks instead of urlretrieve's 8 KiB blocks.
+    
+    Returns (buffer, etag) with the buffer rewound to the start.
+    """
+    import urllib.request
+    
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        # Size the buffer from Content-Length: ~1/16th of the body, between 8 KiB and 1 MiB
+        content_length = int(resp.headers.get('Content-Length') or 0)
+        length = min(max(8192, content_length // 16), 1 << 20) if content_length else 1 << 20
+        buf = io.BytesIO()
+        shutil.copyfileobj(resp, buf, length)
+        buf.seek(0)
+        return buf, resp.headers.get('ETag')
+
+
+class _BackgroundDownload(io.RawIOBase):
+    """Read-only file object over a URL that is downloaded by a background thread.
+    
+    Chunks are handed over through a queue, so the consumer (e.g. a streaming
+    tarfile) can decompress while the rest of the body is still downloading.
+    The queue is bounded, so a slow consumer holds at most max_chunks chunks
+    in memory instead of the whole archive.
+    """
+    
+    def __init__(self, url, chunk_size=1 << 20, max_chunks=4):
+        import queue
+        
+        super().__init__()
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._stop = threading.Event()
+        self._chunk = b''
+        self._offset = 0
+        self._eof = False
+        self._error = None
+        self.etag = None
+        self._sha256 = hashlib.sha256()
+        self._thread = threading.Thread(
+            target=self._produce, args=(url, chunk_size), name="nuvu-uv-download", daemon=True
+        )
+        self._thread.start()
+    
+    def _produce(self, url, chunk_size):
+        import urllib.request
+        
+        try:
+            with urllib.request.urlopen(url, timeout=30) as resp:
+                self.etag = resp.headers.get('ETag')
+                while not self._stop.is_set():
+                    chunk = resp.read(chunk_size)
+                    if not chunk:
+                        break
+                    self._sha256.update(chunk)
+                    self._put(chunk)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._put(None)
+    
+    def _put(self, item):
+        import queue
+        
+        # Block while the queue is full, but give up once the consumer has closed
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        while self._offset >= len(self._chunk):
+            if self._eof:
+                return 0
+            chunk = self._queue.get()
+            if chunk is None:
+                self._eof = True
+                if self._error is not None:
+                    raise self._error
+                return 0
+            self._chunk, self._offset = chunk, 0
+        
+        n = min(len(b), len(self._chunk) - self._offset)
+        b[:n] = self._chunk[self._offset:self._offset + n]
+        self._offset += n
+        return n
+    
+    def hexdigest(self):
+        """Read the rest of the body and return the SHA-256 of everything downloaded."""
+        while self.read(1 << 20):
+            pass
+        return self._sha256.hexdigest()
+    
+    def close(self):
+        # Stop the producer early if we're done before the download finished
+        self._stop.set()
+        super().close()
+
+
+def _open_tar_gz_stream(fileobj):
+    """Open a non-seekable .tar.gz stream, using isal's igzip when installed.
+    
+    igzip decompresses several times faster than the zlib-backed gzip module;
+    without isal this falls back to tarfile's own 'r|gz' mode.
+    """
+    import tarfile
+    
+    try:
+        from isal import igzip
+    except ImportError:
+        return tarfile.open(fileobj=fileobj, mode='r|gz')
+    
+    return tarfile.open(fileobj=igzip.IGzipFile(fileobj=fileobj, mode='rb'), mode='r|')
+
+
+class _ChecksumMismatch(Exception):
+    """Raised when a downloaded uv archive doesn't match its published SHA-256."""
+
+
+def _fetch_expected_sha256(download_url):
+    """Fetch the SHA-256 astral publishes next to each release asset, or None."""
+    import urllib.request
+    
+    try:
+        with urllib.request.urlopen(download_url + '.sha256', timeout=10) as resp:
+            # Format: "<hex digest> *<filename>"
+            return resp.read(256).decode('ascii').split()[0].lower()
+    except Exception as e:
+        _get_logger().debug("[ComfyUI-Nuvu] Could not fetch uv checksum: %s", e)
+        return None
+
+
+def _verify_sha256(actual_hex, expected_hex):
+    """Raise _ChecksumMismatch if expected_hex is known and differs from actual_hex."""
+    if expected_hex and actual_hex != expected_hex:
+        raise _ChecksumMismatch(f"uv checksum mismatch (expected {expected_hex}, got {actual_hex})")
+
+
+def _sha256_buffer(buf):
+    """SHA-256 of a BytesIO, via hashlib.file_digest (OpenSSL, no copy) on 3.11+."""
+    if hasattr(hashlib, 'file_digest'):
+        buf.seek(0)
+        digest = hashlib.file_digest(buf, 'sha256').hexdigest()
+        buf.seek(0)
+        return digest
+    return hashlib.sha256(buf.getbuffer()).hexdigest()
+
+
+def _write_uv_binary(src, uv_exe, verify=None):
+    """Copy the uv binary from src to uv_exe atomically.
+    
+    Writes to a per-process temp file next to uv_exe and renames it into place,
+    so an interrupted or concurrent launch never sees a half-written binary.
+    verify, if given, is called before the rename and may raise to abort it.
+    """
+    tmp_path = f"{uv_exe}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+            dst.flush()
+            os.fsync(dst.fileno())
+        if sys.platform != "win32":
+            os.chmod(tmp_path, 0o755)
+        if verify is not None:
+            verify()
+        os.replace(tmp_path, uv_exe)
+    finally:
+        # Gone already after a successful rename
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+def _read_uv_etag(uv_exe):
+    """Read the ETag of the release archive uv_exe was installed from, or None."""
+    try:
+        with open(uv_exe + '.etag', 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_uv_etag(uv_exe, etag):
+    """Store the release archive's ETag next to uv_exe."""
+    if not etag:
+        return
+    try:
+        with open(uv_exe + '.etag', 'w') as f:
+            f.write(etag)
+    except OSError:
+        pass
+
+
+def _uv_release_unchanged(download_url, etag):
+    """Check with a conditional HEAD request whether the uv release still matches etag."""
+    import urllib.request
+    import urllib.error
+    
+    request = urllib.request.Request(download_url, method='HEAD', headers={'If-None-Match': etag})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            # Some servers ignore If-None-Match on HEAD, so compare the ETag ourselves
+            return resp.headers.get('ETag') == etag
+    except urllib.error.HTTPError as e:
+        return e.code == 304
+
+
+def _download_uv(uv_exe, download_url):
+    """Download the uv release archive and extract the uv binary to uv_exe.
+    
+    The archive is checked against the release's published SHA-256 before the
+    binary is moved into place. Returns the archive's ETag (or None).
+    """
+    expected_sha256 = _fetch_expected_sha256(download_url)
+    
+    if sys.platform == "win32":
+        import zipfile
+        
+        # zipfile needs to seek, but the archive is small enough to keep in memory
+        _get_logger().info("[ComfyUI-Nuvu] Downloading uv...")
+        buf, etag = _download_to_memory(download_url)
+        _verify_sha256(_sha256_buffer(buf), expected_sha256)
+        
+        with zipfile.ZipFile(buf, 'r') as zf:
+            for member in zf.namelist():
+                if member.endswith("uv.exe"):
+                    with zf.open(member) as src:
+                        _write_uv_binary(src, uv_exe)
+                    break
+        return etag
+    
+    # Stream the tarball: a background thread downloads while tarfile decompresses,
+    # so extraction overlaps with network I/O instead of following it. The download
+    # is hashed as it arrives, so verifying only needs the (small) rest of the body.
+    _get_logger().info("[ComfyUI-Nuvu] Downloading uv...")
+    with _BackgroundDownload(download_url) as stream, _open_tar_gz_stream(stream) as tf:
+        def verify():
+            _verify_sha256(stream.hexdigest(), expected_sha256)
+        
+        for member in tf:
+            if member.name.endswith("/uv") or member.name == "uv":
+                with tf.extractfile(member) as src:
+                    _write_uv_binary(src, uv_exe, verify)
+                break
+        return stream.etag
 
 
 def _install_uv():
-    """Install uv to the platform-specific location if not already present."""
-    uv_dir, uv_exe, download_url = _get_uv_paths()
+    """Install uv to the platform-specific location if not already present.
+    
+    Set NUVU_UV_REVALIDATE to re-check an existing install against the latest
+    release. The ETag saved at install time is sent as If-None-Match, so an
+    unchanged release costs one small request instead of a full download.
+    """
+    revalidate = bool(os.environ.get('NUVU_UV_REVALIDATE'))
     
-    if os.path.isfile(uv_exe):
-        return uv_exe
+    # Fast path: a previous launch already recorded where uv lives
+    if _cached_uv_path and not revalidate:
+        return _cached_uv_path
+    
+    uv_dir, uv_exe, download_url = _UV_DIR, _UV_EXE, _DOWNLOAD_URL
+    
+    if _is_uv_binary(uv_exe):
+        if revalidate:
+            etag = _read_uv_etag(uv_exe)
+            try:
+                unchanged = etag is not None and _uv_release_unchanged(download_url, etag)
+            except Exception as e:
+                _get_logger().debug("[ComfyUI-Nuvu] Could not revalidate uv: %s", e)
+                unchanged = True  # Offline - keep the uv we have
+        
+        if not revalidate or unchanged:
+            _write_uv_sentinel(uv_exe)
+            return uv_exe
+        
+        _get_logger().info("[ComfyUI-Nuvu] A newer uv release is available")
     
     try:
         os.makedirs(uv_dir, exist_ok=True)
         
-        if platform.system() == "Windows":
-            import urllib.request
-            import zipfile
-            import tempfile
-            
-            with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-                tmp_path = tmp.name
-            
-            try:
-                logger.info("[ComfyUI-Nuvu] Downloading uv...")
-                urllib.request.urlretrieve(download_url, tmp_path)
-                
-                with zipfile.ZipFile(tmp_path, 'r') as zf:
-                    for member in zf.namelist():
-                        if member.endswith("uv.exe"):
-                            with zf.open(member) as src, open(uv_exe, 'wb') as dst:
-                                dst.write(src.read())
-                            break
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-        else:
-            import urllib.request
-            import tarfile
-            import tempfile
-            
-            with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
-                tmp_path = tmp.name
-            
+        # Retry once if the archive fails its checksum (e.g. a truncated or tampered download)
+        for attempt in range(2):
             try:
-                logger.info("[ComfyUI-Nuvu] Downloading uv...")
-                urllib.request.urlretrieve(download_url, tmp_path)
-                
-                with tarfile.open(tmp_path, 'r:gz') as tf:
-                    for member in tf.getmembers():
-                        if member.name.endswith("/uv") or member.name == "uv":
-                            member.name = "uv"
-                            tf.extract(member, uv_dir)
-                            break
-                
-                os.chmod(uv_exe, 0o755)
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+                etag = _download_uv(uv_exe, download_url)
+                break
+            except _ChecksumMismatch as e:
+                _get_logger().warning("[ComfyUI-Nuvu] %s", e)
+                if attempt:
+                    raise
         
-        if os.path.isfile(uv_exe):
-            logger.info(f"[ComfyUI-Nuvu] uv installed to {uv_exe}")
+        if _is_uv_binary(uv_exe):
+            _get_logger().info("[ComfyUI-Nuvu] uv installed to %s", uv_exe)
+            _write_uv_etag(uv_exe, etag)
+            _write_uv_sentinel(uv_exe)
             return uv_exe
     except Exception as e:
-        logger.warning(f"[ComfyUI-Nuvu] Failed to install uv: {e}")
+        _get_logger().warning("[ComfyUI-Nuvu] Failed to install uv: %s", e)
     
     return None
 
 
-def _build_install_cmd(uv_path, requirements_path):
-    """Build the install command for requirements."""
-    is_embedded = "python_embeded" in sys.executable.lower()
+def _install_uv_in_background():
+    """Install uv off the prestartup thread and signal _uv_ready when done."""
+    try:
+        _install_uv()
+    finally:
+        _uv_ready.set()
+
+
+def _build_install_cmd(uv_path, *requirements_paths):
+    """Build the install command for one or more requirements files."""
     if uv_path:
         cmd = [uv_path, 'pip', 'install', '--quiet']
-        if is_embedded:
+        if _IS_EMBEDDED:
             cmd.extend(['--system', '--python', sys.executable])
-        cmd.extend(['-r', requirements_path])
     else:
-        base = [sys.executable]
-        if is_embedded:
-            base.append('-s')
-        cmd = base + ['-m', 'pip', 'install', '--quiet', '-r', requirements_path]
+        cmd = [*_PIP_INSTALL, '--quiet']
+    for requirements_path in requirements_paths:
+        cmd.extend(['-r', requirements_path])
     return cmd
 
 
-def _run_requirements_install(name, repo_path, requirements_filename, uv_path):
-    """Install requirements for a specific repo if needed."""
-    requirements_path = os.path.join(repo_path, requirements_filename)
+def _requirements_install_needed(repo_path, requirements_filename='requirements.txt'):
+    """Check whether a repo's requirements changed or were marked for retry."""
+    # One stat answers both "is there a requirements file" and the cache check
+    try:
+        st = os.stat(os.path.join(repo_path, requirements_filename))
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+    return _requirements_need_install(repo_path, requirements_filename, st) or _has_pending_install_marker(repo_path)
+
+
+def _installed_distribution_versions():
+    """Map canonical name -> version for every installed distribution, in one scan."""
+    from importlib.metadata import distributions
     
-    if not os.path.isfile(requirements_path):
-        return
+    versions = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            versions.setdefault(_canonicalize_name(name), dist.version)
+    return versions
+
+
+def _requirements_satisfied(requirements_path, installed):
+    """Check a requirements file against installed versions without running pip.
     
-    # Check if we need to install (either requirements changed OR pending marker exists)
-    needs_install = _requirements_need_install(repo_path, requirements_filename)
-    has_pending = _has_pending_install_marker(repo_path)
+    Anything that can't be checked locally (options, URLs, extras, markers
+    without packaging) counts as unsatisfied so the real installer decides.
+    """
+    try:
+        with open(requirements_path, 'r') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return False
+    
+    for line in lines:
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('-') or '://' in line or '@' in line or '[' in line:
+            return False
+        
+        if ';' in line:
+            try:
+                from packaging.markers import Marker
+                if not Marker(line.split(';', 1)[1]).evaluate():
+                    continue
+            except Exception:
+                return False
+        
+        req = _parse_requirement(line)
+        if not req:
+            return False
+        pkg_name, version_spec = req
+        installed_version = installed.get(_canonicalize_name(pkg_name))
+        if installed_version is None or not _version_satisfies_strict(installed_version, version_spec):
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _version_satisfies_strict(installed_version, version_spec):
+    """Like _version_satisfies_spec, but anything that can't be parsed counts as unsatisfied.
+    
+    Used to decide whether the installer can be skipped, so there is no
+    best-effort fallback: without packaging, or with a version or spec it
+    rejects, the answer is False.
+    """
+    if not version_spec:
+        return True
+    try:
+        from packaging.version import Version
+        from packaging.specifiers import SpecifierSet
+        
+        return SpecifierSet(version_spec).contains(Version(installed_version), prereleases=True)
+    except Exception:
+        return False
+
+
+def _requirements_batchable(requirements_path):
+    """Check that a requirements file means the same thing from any working directory.
+    
+    Editable installs and relative or file: paths resolve against the cwd, and
+    the batched install can't run from each repo, so such files are installed
+    on their own.
+    """
+    try:
+        with open(requirements_path, 'r') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return False
+    
+    for line in lines:
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith(('-e', '--editable', '.')) or 'file:' in line:
+            return False
+        first = line.split(None, 1)[0]
+        if '://' not in first and ('/' in first or '\\' in first):
+            return False
+    return True
+
+
+def _run_requirements_install_batch(targets, uv_path):
+    """Install several repos' requirements with a single uv call.
+    
+    One resolver pass covers every requirements file, so shared dependencies
+    are resolved and downloaded once. targets is a list of (name, repo_path).
+    Returns True on success; on failure nothing is marked and the caller
+    falls back to installing each repo on its own.
+    """
+    names = ', '.join(name for name, _ in targets)
+    _get_logger().info("[ComfyUI-Nuvu] Installing requirements for %s...", names)
+    
+    cmd = _build_install_cmd(uv_path, *(os.path.join(path, 'requirements.txt') for _, path in targets))
+    torch_index = get_torch_index_url()
+    if torch_index:
+        cmd.extend(['--extra-index-url', torch_index])
+    
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=900)
+    except Exception as e:
+        _get_logger().warning("[ComfyUI-Nuvu] Batched requirements install error, installing each repo separately: %s", e)
+        return False
+    
+    if result.returncode != 0:
+        _get_logger().warning("[ComfyUI-Nuvu] Batched requirements install failed, installing each repo separately: %s", (result.stderr or "")[:300])
+        return False
+    
+    for name, repo_path in targets:
+        _mark_requirements_installed(repo_path)
+        _remove_pending_install_marker(repo_path)
+    _get_logger().info("[ComfyUI-Nuvu] Requirements installed successfully for %s", names)
+    return True
+
+
+# Output that means a file is held open (usually a loaded .pyd on Windows)
+_LOCK_RE = re.compile('Access is denied|os error 5|failed to remove file|being used by another process')
+
+
+def _run_streaming(cmd, log, label, timeout, cwd=None, watch=None):
+    """Run cmd, logging its output line by line at debug level as it arrives.
+    
+    Only the last few lines are kept in memory, and they are logged as a
+    warning if cmd fails. Returns (returncode, matched) where matched tells
+    whether any line matched the compiled pattern watch. Raises
+    subprocess.TimeoutExpired if cmd runs past timeout.
+    """
+    from collections import deque
+    
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors='replace',
+        cwd=cwd,
+    )
+    timed_out = threading.Event()
+    
+    def _kill():
+        timed_out.set()
+        proc.kill()
+    
+    timer = threading.Timer(timeout, _kill)
+    timer.daemon = True
+    timer.start()
+    tail = deque(maxlen=20)
+    matched = False
+    try:
+        with proc.stdout:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                log.debug("[ComfyUI-Nuvu] [%s] %s", label, line)
+                tail.append(line)
+                if not matched and watch is not None:
+                    matched = watch.search(line) is not None
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if returncode != 0 and tail:
+        log.warning("[ComfyUI-Nuvu] [%s] %s", label, '\n'.join(tail))
+    return returncode, matched
+
+
+_log_lock = threading.Lock()
+
+
+class _BufferedLog:
+    """Collects log calls from a worker thread and emits them in one block."""
+    
+    def __init__(self):
+        self._records = []
+    
+    def debug(self, msg, *args):
+        self._records.append((logging.DEBUG, msg, args))
+    
+    def info(self, msg, *args):
+        self._records.append((logging.INFO, msg, args))
+    
+    def warning(self, msg, *args):
+        self._records.append((logging.WARNING, msg, args))
     
-    if not needs_install and not has_pending:
-        logger.debug(f"[ComfyUI-Nuvu] {name} requirements already up to date")
+    def flush(self):
+        """Emit the buffered records under _log_lock so workers don't interleave."""
+        records, self._records = self._records, []
+        if not records:
+            return
+        log = _get_logger()
+        with _log_lock:
+            for level, msg, args in records:
+                log.log(level, msg, *args)
+
+
+def _run_buffered_requirements_install(name, repo_path, requirements_filename, uv_path):
+    """Thread-pool wrapper around _run_requirements_install with buffered logging."""
+    log = _BufferedLog()
+    try:
+        _run_requirements_install(name, repo_path, requirements_filename, uv_path, log=log)
+    finally:
+        log.flush()
+
+
+def _run_requirements_install(name, repo_path, requirements_filename, uv_path, log=None):
+    """Install requirements for a specific repo if needed.
+    
+    ``log`` defaults to the module logger; parallel workers pass a
+    _BufferedLog so their lines come out together.
+    """
+    log = log or _get_logger()
+    requirements_path = os.path.join(repo_path, requirements_filename)
+    
+    # Check if we need to install (either requirements changed OR pending marker exists)
+    if not _requirements_install_needed(repo_path, requirements_filename):
+        log.debug("[ComfyUI-Nuvu] %s requirements already up to date", name)
         return
     
-    logger.info(f"[ComfyUI-Nuvu] Installing {name} requirements...")
+    log.info("[ComfyUI-Nuvu] Installing %s requirements...", name)
     
     cmd = _build_install_cmd(uv_path, requirements_path)
     
@@ -367,51 +1138,47 @@ def _run_requirements_install(name, repo_path, requirements_filename, uv_path):
     torch_index = get_torch_index_url()
     if torch_index:
         cmd.extend(['--extra-index-url', torch_index])
-        logger.debug(f"[ComfyUI-Nuvu] Using torch index: {torch_index}")
+        log.debug("[ComfyUI-Nuvu] Using torch index: %s", torch_index)
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600,
-            cwd=repo_path,
-        )
+        returncode, locked = _run_streaming(cmd, log, name, timeout=600, cwd=repo_path, watch=_LOCK_RE)
         
-        if result.returncode == 0:
-            logger.info(f"[ComfyUI-Nuvu] {name} requirements installed successfully")
+        if returncode == 0:
+            log.info("[ComfyUI-Nuvu] %s requirements installed successfully", name)
             _mark_requirements_installed(repo_path, requirements_filename)
             _remove_pending_install_marker(repo_path)  # Clear pending marker on success
+        elif locked:
+            log.warning("[ComfyUI-Nuvu] %s requirements have file locks - will retry on next restart", name)
+            _create_pending_install_marker(repo_path)  # Mark for retry
         else:
-            output = (result.stderr or "") + (result.stdout or "")
-            # Check for file lock errors
-            lock_indicators = ['Access is denied', 'os error 5', 'failed to remove file', 'being used by another process']
-            if any(ind in output for ind in lock_indicators):
-                logger.warning(f"[ComfyUI-Nuvu] {name} requirements have file locks - will retry on next restart")
-                _create_pending_install_marker(repo_path)  # Mark for retry
-            else:
-                logger.warning(f"[ComfyUI-Nuvu] {name} requirements install issue: {output[:300]}")
+            log.warning("[ComfyUI-Nuvu] %s requirements install issue (exit code %d)", name, returncode)
     except subprocess.TimeoutExpired:
-        logger.warning(f"[ComfyUI-Nuvu] {name} requirements install timed out")
+        log.warning("[ComfyUI-Nuvu] %s requirements install timed out", name)
         _create_pending_install_marker(repo_path)  # Mark for retry
     except Exception as e:
-        logger.warning(f"[ComfyUI-Nuvu] {name} requirements install error: {e}")
+        log.warning("[ComfyUI-Nuvu] %s requirements install error: %s", name, e)
+
+
+# Marker path relative to a repo, joined by plain concatenation since it's
+# built for every custom node on every launch
+_PENDING_MARKER_SUFFIX = os.sep + os.path.join('.nuvu', 'pending_requirements')
 
 
 def _has_pending_install_marker(repo_path):
     """Check if a repo has a pending install marker (created when install fails due to file locks)."""
-    marker_path = os.path.join(repo_path, '.nuvu', 'pending_requirements')
-    return os.path.exists(marker_path)
+    return _cached_isfile(repo_path + _PENDING_MARKER_SUFFIX)
 
 
 def _create_pending_install_marker(repo_path):
     """Create a marker to indicate requirements need to be installed on next restart."""
-    nuvu_dir = os.path.join(repo_path, '.nuvu')
-    os.makedirs(nuvu_dir, exist_ok=True)
-    marker_path = os.path.join(nuvu_dir, 'pending_requirements')
+    marker_path = repo_path + _PENDING_MARKER_SUFFIX
     try:
-        with open(marker_path, 'w') as f:
-            f.write('')
+        try:
+            open(marker_path, 'w').close()
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(marker_path), exist_ok=True)
+            open(marker_path, 'w').close()
+        _invalidate_path_cache()
         return True
     except Exception:
         return False
@@ -419,11 +1186,11 @@ def _create_pending_install_marker(repo_path):
 
 def _remove_pending_install_marker(repo_path):
     """Remove the pending install marker after successful install."""
-    marker_path = os.path.join(repo_path, '.nuvu', 'pending_requirements')
+    marker_path = repo_path + _PENDING_MARKER_SUFFIX
     try:
-        if os.path.exists(marker_path):
-            os.remove(marker_path)
-    except Exception:
+        os.remove(marker_path)
+        _invalidate_path_cache()
+    except OSError:
         pass
 
 
@@ -436,34 +1203,71 @@ def _get_custom_nodes_with_pending_requirements(custom_nodes_dir):
     """
     pending = []
     
-    if not os.path.isdir(custom_nodes_dir):
+    # scandir gets the entry type from the directory listing itself, so only
+    # symlinked nodes need an extra stat for is_dir()
+    try:
+        entries = os.scandir(custom_nodes_dir)
+    except OSError:
         return pending
     
-    for node_name in os.listdir(custom_nodes_dir):
-        node_path = os.path.join(custom_nodes_dir, node_name)
-        
-        # Skip non-directories and hidden folders
-        if not os.path.isdir(node_path) or node_name.startswith('.'):
-            continue
-        
-        # Skip Nuvu itself (handled separately)
-        if node_name in ('ComfyUI-Nuvu', 'ComfyUI-Nuvu-Packager'):
-            continue
-        
-        # Only process nodes with pending install marker
-        # This prevents reinstalling all nodes on every startup
-        if _has_pending_install_marker(node_path):
-            pending.append((node_name, node_path))
+    with entries:
+        for entry in entries:
+            node_name = entry.name
+            
+            # Skip hidden folders and Nuvu itself (handled separately)
+            if node_name.startswith('.') or node_name in ('ComfyUI-Nuvu', 'ComfyUI-Nuvu-Packager'):
+                continue
+            
+            try:
+                if not entry.is_dir():
+                    continue
+            except OSError:
+                continue
+            
+            # Only process nodes with pending install marker
+            # This prevents reinstalling all nodes on every startup
+            if _has_pending_install_marker(entry.path):
+                pending.append((node_name, entry.path))
     
     return pending
 
 
+@functools.lru_cache(maxsize=1)
+def _user_nuvu_root():
+    """Get <ComfyUI>/user/default/.nuvu, where pending install/uninstall markers live."""
+    comfyui_root = _detect_comfyui_root() or os.path.dirname(os.path.dirname(_script_dir))
+    return os.path.join(comfyui_root, 'user', 'default', '.nuvu')
+
+
+def _list_pending_markers(subdir):
+    """List the .txt marker paths in a user .nuvu subdirectory without creating it.
+    
+    Most launches have no markers at all, so a missing directory is the fast path.
+    """
+    try:
+        with os.scandir(os.path.join(_user_nuvu_root(), subdir)) as it:
+            return [entry.path for entry in it if entry.name.endswith('.txt') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _read_marker(path):
+    """Read a marker file, returning (path, content, error)."""
+    try:
+        with open(path, 'r') as f:
+            return path, f.read(), None
+    except Exception as e:
+        return path, None, e
+
+
+def _read_markers(marker_paths):
+    """Read several marker files, returning a (path, content, error) tuple for each."""
+    return [_read_marker(path) for path in marker_paths]
+
+
 def _get_pending_uninstalls_dir():
     """Get the directory for pending uninstall markers."""
-    comfyui_root = _detect_comfyui_root() or os.path.dirname(os.path.dirname(_script_dir))
-    nuvu_dir = os.path.join(comfyui_root, 'user', 'default', '.nuvu', 'pending_uninstalls')
-    os.makedirs(nuvu_dir, exist_ok=True)
-    return nuvu_dir
+    return _ensure_dir(os.path.join(_user_nuvu_root(), 'pending_uninstalls'))
 
 
 def _migrate_old_pending_markers():
@@ -475,9 +1279,9 @@ def _migrate_old_pending_markers():
             new_dir = _get_pending_uninstalls_dir()
             new_path = os.path.join(new_dir, 'triton.txt')
             shutil.move(old_triton_marker, new_path)
-            logger.info("[ComfyUI-Nuvu] Migrated old triton uninstall marker to new location")
+            _get_logger().info("[ComfyUI-Nuvu] Migrated old triton uninstall marker to new location")
         except Exception as e:
-            logger.debug(f"[ComfyUI-Nuvu] Could not migrate old marker: {e}")
+            _get_logger().debug("[ComfyUI-Nuvu] Could not migrate old marker: %s", e)
 
 
 def _get_all_pending_uninstall_markers():
@@ -485,21 +1289,10 @@ def _get_all_pending_uninstall_markers():
     # First, migrate any old-style markers
     _migrate_old_pending_markers()
     
-    pending_dir = _get_pending_uninstalls_dir()
-    markers = []
-    
-    logger.debug(f"[ComfyUI-Nuvu] Checking for pending uninstalls in: {pending_dir}")
-    
-    if not os.path.isdir(pending_dir):
-        logger.debug(f"[ComfyUI-Nuvu] Pending uninstalls directory does not exist")
-        return markers
-    
-    for filename in os.listdir(pending_dir):
-        if filename.endswith('.txt'):
-            markers.append(os.path.join(pending_dir, filename))
+    markers = _list_pending_markers('pending_uninstalls')
     
     if markers:
-        logger.debug(f"[ComfyUI-Nuvu] Found pending uninstall markers: {markers}")
+        _get_logger().debug("[ComfyUI-Nuvu] Found pending uninstall markers: %s", markers)
     
     return markers
 
@@ -509,148 +1302,201 @@ def _force_delete_package(pkg_name):
     
     Used when pip/uv can't uninstall due to missing RECORD file.
     """
-    import site
-    import re
+    # Match the package directory itself (like "torch") or its metadata directory
+    # (like "torch-2.10.0+cu130.dist-info" or "torch-2.10.0.egg-info") by PEP 503
+    # canonical name. The version must start with a digit so "torch" doesn't
+    # match "torchvision".
+    target = _canonicalize_name(pkg_name)
+    # Canonical names keep their first character, so most entries can be
+    # skipped on one character without normalizing the whole name
+    first = target[:1]
+    
+    paths = []
+    for sp_dir in _site_packages_dirs():
+        try:
+            with os.scandir(sp_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name[:1].lower() != first:
+                        continue
+                    if name.lower().endswith(('.dist-info', '.egg-info')):
+                        base, _, version = name.partition('-')
+                        is_match = version[:1].isdigit() and _canonicalize_name(base) == target
+                    else:
+                        is_match = _canonicalize_name(name) == target
+                    if is_match and entry.is_dir(follow_symlinks=False):
+                        paths.append(entry.path)
+        except Exception as e:
+            _get_logger().debug("[ComfyUI-Nuvu] Error scanning %s: %s", sp_dir, e)
     
-    # Get site-packages directories
-    site_packages_dirs = site.getsitepackages()
-    if hasattr(site, 'getusersitepackages'):
-        user_site = site.getusersitepackages()
-        if user_site:
-            site_packages_dirs.append(user_site)
+    # Delete after scanning so the directories aren't modified mid-iteration
+    deleted = False
+    for path in paths:
+        print(f"[ComfyUI-Nuvu] Force deleting: {path}", flush=True)
+        try:
+            _rmtree(path)
+            deleted = True
+        except OSError as e:
+            print(f"[ComfyUI-Nuvu] Could not delete {path}: {e}", flush=True)
     
-    # Normalize package name for directory matching (pip uses underscores internally)
-    pkg_normalized = pkg_name.lower().replace('-', '_')
+    return deleted
+
+
+def _run_pending_uninstalls(uv_path, markers=None):
+    """Uninstall all packages that were marked for removal on restart.
     
-    deleted = False
-    for sp_dir in site_packages_dirs:
-        if not os.path.isdir(sp_dir):
-            continue
-        
+    This is a generic system that handles any installer's pending uninstalls.
+    Marker files are stored in .nuvu/pending_uninstalls/<name>.txt
+    Each file contains package names, one per line.
+    
+    Always uses pip for uninstalls (not uv) because pip is more lenient about
+    missing RECORD files and other metadata issues. All markers are handled by
+    a single pip process; if that fails, each marker is retried on its own and
+    falls back to force deletion.
+    
+    markers may be passed in when the caller has already listed them.
+    """
+    if markers is None:
+        markers = _get_all_pending_uninstall_markers()
+    
+    if not markers:
+        return
+    
+    print(f"\n[ComfyUI-Nuvu] Processing {len(markers)} pending uninstall(s)...", flush=True)
+    
+    # Read every marker up front so all packages go through a single pip process
+    marker_packages = {}
+    for marker_path, content, error in _read_markers(markers):
+        marker_name = os.path.basename(marker_path).replace('.txt', '')
         try:
-            for item in os.listdir(sp_dir):
-                item_lower = item.lower().replace('-', '_')
-                
-                # Check for exact match (package directory like "torch" or "torchvision")
-                is_exact_match = item_lower == pkg_normalized
-                
-                # Check for metadata directory (like "torch_2.10.0.dist_info" or "torch_2.10.0+cu130.dist_info")
-                # Pattern: {package}_{version}.dist_info or .egg_info
-                # The version starts with a digit, so we check for {pkg}_{digit}
-                is_metadata = bool(re.match(rf'^{re.escape(pkg_normalized)}_\d', item_lower)) and \
-                              ('dist_info' in item_lower or 'dist-info' in item_lower or 
-                               'egg_info' in item_lower or 'egg-info' in item_lower)
-                
-                if is_exact_match or is_metadata:
-                    item_path = os.path.join(sp_dir, item)
-                    if os.path.isdir(item_path):
-                        print(f"[ComfyUI-Nuvu] Force deleting: {item_path}", flush=True)
-                        shutil.rmtree(item_path, ignore_errors=True)
-                        deleted = True
+            if error is not None:
+                raise error
+            packages = [pkg.strip() for pkg in content.strip().split('\n') if pkg.strip()]
+            
+            if not packages:
+                os.remove(marker_path)
+                continue
+            
+            print(f"[ComfyUI-Nuvu] Pending {marker_name} uninstall: {', '.join(packages)}", flush=True)
+            marker_packages[marker_path] = packages
         except Exception as e:
-            logger.debug(f"[ComfyUI-Nuvu] Error scanning {sp_dir}: {e}")
+            print(f"[ComfyUI-Nuvu] Pending {marker_name} uninstall error: {e}", flush=True)
     
-    return deleted
+    if not marker_packages:
+        return
+    
+    all_packages = list(dict.fromkeys(pkg for packages in marker_packages.values() for pkg in packages))
+    
+    try:
+        result = _run_pip_uninstall(all_packages)
+        if result.returncode == 0:
+            print(f"[ComfyUI-Nuvu] Uninstalled: {', '.join(all_packages)}", flush=True)
+            for marker_path in marker_packages:
+                os.remove(marker_path)
+            return
+    except Exception as e:
+        print(f"[ComfyUI-Nuvu] Batched uninstall error: {e}", flush=True)
+    
+    # The batch failed, but pip removes what it can before bailing out, so
+    # only markers that still have something installed need another pass
+    importlib.invalidate_caches()
+    for marker_path, packages in marker_packages.items():
+        if any(_is_distribution_installed(pkg) for pkg in packages):
+            _uninstall_marker_packages(marker_path, packages)
+            continue
+        print(f"[ComfyUI-Nuvu] Uninstalled: {', '.join(packages)}", flush=True)
+        try:
+            os.remove(marker_path)
+        except OSError:
+            pass
 
 
-def _run_pending_uninstalls(uv_path):
-    """Uninstall all packages that were marked for removal on restart.
-    
-    This is a generic system that handles any installer's pending uninstalls.
-    Marker files are stored in .nuvu/pending_uninstalls/<name>.txt
-    Each file contains package names, one per line.
+def _is_distribution_installed(pkg_name):
+    """Check whether a distribution is installed, in-process instead of via pip show."""
+    from importlib.metadata import distribution, PackageNotFoundError
     
-    Always uses pip for uninstalls (not uv) because pip is more lenient about
-    missing RECORD files and other metadata issues.
+    try:
+        distribution(pkg_name)
+        return True
+    except PackageNotFoundError:
+        return False
+
+
+def _run_pip_uninstall(packages):
+    """Run pip uninstall -y for packages.
     
-    If pip fails, falls back to force deletion.
+    Always uses pip for uninstalls - it's more lenient about missing RECORD files.
     """
-    markers = _get_all_pending_uninstall_markers()
+    cmd = [*_PIP_UNINSTALL, *packages]
     
-    if not markers:
-        return
+    print(f"[ComfyUI-Nuvu] Running: {' '.join(cmd)}", flush=True)
     
-    print(f"\n[ComfyUI-Nuvu] Processing {len(markers)} pending uninstall(s)...", flush=True)
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _uninstall_marker_packages(marker_path, packages):
+    """Uninstall one marker's packages, verifying and force deleting as needed."""
+    marker_name = os.path.basename(marker_path).replace('.txt', '')
     
-    for marker_path in markers:
-        marker_name = os.path.basename(marker_path).replace('.txt', '')
+    try:
+        result = _run_pip_uninstall(packages)
         
-        try:
-            with open(marker_path, 'r') as f:
-                packages = [pkg.strip() for pkg in f.read().strip().split('\n') if pkg.strip()]
-            
-            if not packages:
-                os.remove(marker_path)
-                continue
-            
-            print(f"[ComfyUI-Nuvu] Pending {marker_name} uninstall: {', '.join(packages)}", flush=True)
-            
-            # Always use pip for uninstalls - it's more lenient about missing RECORD files
-            is_embedded = "python_embeded" in sys.executable.lower()
-            base = [sys.executable]
-            if is_embedded:
-                base.append('-s')
-            cmd = base + ['-m', 'pip', 'uninstall', '-y']
-            
-            cmd.extend(packages)
-            
-            print(f"[ComfyUI-Nuvu] Running: {' '.join(cmd)}", flush=True)
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+        if result.returncode == 0:
+            print(f"[ComfyUI-Nuvu] Uninstalled: {', '.join(packages)}", flush=True)
+            os.remove(marker_path)
+        else:
+            # Check if RECORD file error - need force deletion
+            error_output = result.stderr + result.stdout
+            is_record_error = 'RECORD' in error_output and 'not found' in error_output.lower()
             
-            if result.returncode == 0:
-                for pkg in packages:
+            # Check if packages are actually gone despite error
+            # (pip just changed site-packages, so drop any cached metadata lookups)
+            importlib.invalidate_caches()
+            all_gone = True
+            still_installed = []
+            for pkg in packages:
+                if _is_distribution_installed(pkg):
+                    # Package still installed
+                    if is_record_error:
+                        # Try force deletion
+                        print(f"[ComfyUI-Nuvu] RECORD file missing for {pkg}, trying force delete...", flush=True)
+                        if _force_delete_package(pkg):
+                            # Verify it's gone
+                            importlib.invalidate_caches()
+                            if not _is_distribution_installed(pkg):
+                                print(f"[ComfyUI-Nuvu] Force deleted: {pkg}", flush=True)
+                                continue
+                    all_gone = False
+                    still_installed.append(pkg)
+                else:
                     print(f"[ComfyUI-Nuvu] Uninstalled: {pkg}", flush=True)
+            
+            if all_gone:
+                print(f"[ComfyUI-Nuvu] {marker_name} packages verified removed", flush=True)
                 os.remove(marker_path)
             else:
-                # Check if RECORD file error - need force deletion
-                error_output = result.stderr + result.stdout
-                is_record_error = 'RECORD' in error_output and 'not found' in error_output.lower()
-                
-                # Check if packages are actually gone despite error
-                all_gone = True
-                still_installed = []
-                for pkg in packages:
-                    check_cmd = [sys.executable, '-m', 'pip', 'show', pkg]
-                    check_result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=30)
-                    if check_result.returncode == 0:
-                        # Package still installed
-                        if is_record_error:
-                            # Try force deletion
-                            print(f"[ComfyUI-Nuvu] RECORD file missing for {pkg}, trying force delete...", flush=True)
-                            if _force_delete_package(pkg):
-                                # Verify it's gone
-                                verify_cmd = [sys.executable, '-m', 'pip', 'show', pkg]
-                                verify_result = subprocess.run(verify_cmd, capture_output=True, text=True, timeout=30)
-                                if verify_result.returncode != 0:
-                                    print(f"[ComfyUI-Nuvu] Force deleted: {pkg}", flush=True)
-                                    continue
-                        all_gone = False
-                        still_installed.append(pkg)
-                    else:
-                        print(f"[ComfyUI-Nuvu] Uninstalled: {pkg}", flush=True)
-                
-                if all_gone:
-                    print(f"[ComfyUI-Nuvu] {marker_name} packages verified removed", flush=True)
-                    os.remove(marker_path)
-                else:
-                    print(f"[ComfyUI-Nuvu] {marker_name} uninstall incomplete, still installed: {', '.join(still_installed)}", flush=True)
-        
-        except Exception as e:
-            print(f"[ComfyUI-Nuvu] Pending {marker_name} uninstall error: {e}", flush=True)
+                print(f"[ComfyUI-Nuvu] {marker_name} uninstall incomplete, still installed: {', '.join(still_installed)}", flush=True)
+    
+    except Exception as e:
+        print(f"[ComfyUI-Nuvu] Pending {marker_name} uninstall error: {e}", flush=True)
 
 
-def _get_pending_installs_dir():
-    """Get the directory for pending install markers."""
-    comfyui_root = _detect_comfyui_root() or os.path.dirname(os.path.dirname(_script_dir))
-    nuvu_dir = os.path.join(comfyui_root, 'user', 'default', '.nuvu', 'pending_installs')
-    os.makedirs(nuvu_dir, exist_ok=True)
-    return nuvu_dir
+_PEP503_SEPARATORS_RE = re.compile(r'[-_.]+')
+
+
+def _canonicalize_name(name):
+    """PEP 503 name normalization (same result as packaging.utils.canonicalize_name)."""
+    return _PEP503_SEPARATORS_RE.sub('-', name).lower()
+
+
+# pip flags whose value is the next argument
+_FLAGS_WITH_VALUE = frozenset({'--index-url', '--extra-index-url', '--find-links', '-f'})
+_SPEC_SPLIT_RE = re.compile(r'[<>=!~\[;@\s]')
 
 
 def _extract_package_names(spec_parts):
@@ -658,7 +1504,7 @@ def _extract_package_names(spec_parts):
     Extract just the package names from a spec_parts list.
     
     Filters out flags (--force-reinstall, --index-url, etc.) and their values,
-    returning only package names/specs like 'torch==2.10.0', 'torchvision'.
+    returning canonical package names like 'torch' for 'torch==2.10.0'.
     """
     packages = []
     skip_next = False
@@ -668,26 +1514,80 @@ def _extract_package_names(spec_parts):
             skip_next = False
             continue
         
-        if part.startswith('--'):
-            # Check if this flag takes a value
-            if part in ['--index-url', '--extra-index-url', '--find-links', '-f']:
-                skip_next = True
+        if part in _FLAGS_WITH_VALUE:
+            skip_next = True
             continue
         elif part.startswith('-'):
-            # Short flags like -U, -q
+            # Other flags like --force-reinstall, -U, -q
             continue
         else:
             # This is a package name/spec
-            # Extract just the package name (before == or >= etc.)
-            import re
-            pkg_name = re.split(r'[<>=!]', part)[0]
+            # Extract just the package name (before ==, >=, extras, markers etc.)
+            pkg_name = _SPEC_SPLIT_RE.split(part, 1)[0]
             if pkg_name:
-                packages.append(pkg_name)
+                packages.append(_canonicalize_name(pkg_name))
     
     return packages
 
 
-def _run_pending_installs(uv_path):
+# Characters that make shlex.split differ from str.split
+_SHLEX_SPECIAL = frozenset('"\'\\')
+
+
+def _split_spec(spec):
+    """Split a pending install spec into arguments.
+    
+    Specs are almost always plain whitespace-separated words; shlex is only
+    needed (and only imported) when the spec contains quotes or escapes.
+    """
+    if _SHLEX_SPECIAL.isdisjoint(spec):
+        return spec.split()
+    import shlex
+    return shlex.split(spec)
+
+
+def _install_pending_spec(spec_parts, uv_path):
+    """Uninstall the packages in spec_parts, then install them fresh.
+    
+    Returns the completed install process.
+    """
+    # Extract package names for uninstall step
+    package_names = _extract_package_names(spec_parts)
+    
+    # Step 1: Uninstall packages first to ensure clean state
+    # This avoids CUDA version mismatches and broken metadata issues
+    if package_names:
+        print(f"[ComfyUI-Nuvu] Uninstalling first: {', '.join(package_names)}", flush=True)
+        if uv_path:
+            uninstall_cmd = [uv_path, 'pip', 'uninstall']
+            if _IS_EMBEDDED:
+                uninstall_cmd.extend(['--python', sys.executable])
+            uninstall_cmd.extend(['-y'] + package_names)
+        else:
+            uninstall_cmd = [*_PIP_UNINSTALL, *package_names]
+        
+        uninstall_result = subprocess.run(uninstall_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
+        if uninstall_result.returncode != 0:
+            # If uninstall fails, try force-deleting from site-packages
+            for pkg in package_names:
+                _force_delete_package(pkg)
+    
+    # Step 2: Install packages
+    # Translate --force-reinstall to --reinstall for uv
+    if uv_path:
+        spec_parts = [p if p != '--force-reinstall' else '--reinstall' for p in spec_parts]
+        cmd = [uv_path, 'pip', 'install']
+        if _IS_EMBEDDED:
+            cmd.extend(['--python', sys.executable])
+        cmd.extend(spec_parts)
+    else:
+        cmd = [*_PIP_INSTALL, *spec_parts]
+    
+    print(f"[ComfyUI-Nuvu] Installing: {' '.join(cmd)}", flush=True)
+    return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=600)
+
+
+def _run_pending_installs(uv_path, markers=None):
     """Install all packages that were marked for installation on restart.
     
     This handles packages that failed to install due to locked files.
@@ -697,30 +1597,27 @@ def _run_pending_installs(uv_path):
     For reliability, we:
     1. Uninstall the packages first (to avoid CUDA version mismatches, broken metadata)
     2. Then install fresh
-    """
-    pending_dir = _get_pending_installs_dir()
     
-    if not os.path.isdir(pending_dir):
-        return
+    Markers that are plain package specs share one uninstall and one install
+    process; markers with flags (index URLs, --pre, ...) are installed on their own.
     
-    markers = [f for f in os.listdir(pending_dir) if f.endswith('.txt')]
+    markers may be passed in when the caller has already listed them.
+    """
+    if markers is None:
+        markers = _list_pending_markers('pending_installs')
     
     if not markers:
         return
     
     print(f"\n[ComfyUI-Nuvu] Processing {len(markers)} pending install(s)...", flush=True)
     
-    is_embedded = "python_embeded" in sys.executable.lower()
-    
-    # Use uv if available, otherwise pip
-    use_uv = uv_path is not None
-    
-    for filename in markers:
-        marker_path = os.path.join(pending_dir, filename)
-        
+    # Read and split every marker up front: (marker_path, package_spec, spec_parts)
+    pending = []
+    for marker_path, content, error in _read_markers(markers):
         try:
-            with open(marker_path, 'r') as f:
-                package_spec = f.read().strip()
+            if error is not None:
+                raise error
+            package_spec = content.strip()
             
             if not package_spec:
                 os.remove(marker_path)
@@ -729,49 +1626,37 @@ def _run_pending_installs(uv_path):
             print(f"[ComfyUI-Nuvu] Pending install: {package_spec}", flush=True)
             
             # Split the package spec to handle args like --pre --extra-index-url
-            import shlex
-            spec_parts = shlex.split(package_spec)
-            
-            # Extract package names for uninstall step
-            package_names = _extract_package_names(spec_parts)
-            
-            # Step 1: Uninstall packages first to ensure clean state
-            # This avoids CUDA version mismatches and broken metadata issues
-            if package_names:
-                print(f"[ComfyUI-Nuvu] Uninstalling first: {', '.join(package_names)}", flush=True)
-                if use_uv:
-                    uninstall_cmd = [uv_path, 'pip', 'uninstall']
-                    if is_embedded:
-                        uninstall_cmd.extend(['--python', sys.executable])
-                    uninstall_cmd.extend(['-y'] + package_names)
-                else:
-                    uninstall_cmd = [sys.executable]
-                    if is_embedded:
-                        uninstall_cmd.append('-s')
-                    uninstall_cmd.extend(['-m', 'pip', 'uninstall', '-y'] + package_names)
-                
-                uninstall_result = subprocess.run(uninstall_cmd, capture_output=True, text=True, timeout=120)
-                if uninstall_result.returncode != 0:
-                    # If uninstall fails, try force-deleting from site-packages
-                    for pkg in package_names:
-                        _force_delete_package(pkg)
-            
-            # Step 2: Install packages
-            # Translate --force-reinstall to --reinstall for uv
-            if use_uv:
-                spec_parts = [p if p != '--force-reinstall' else '--reinstall' for p in spec_parts]
-                cmd = [uv_path, 'pip', 'install']
-                if is_embedded:
-                    cmd.extend(['--python', sys.executable])
-                cmd.extend(spec_parts)
+            pending.append((marker_path, package_spec, _split_spec(package_spec)))
+        except Exception as e:
+            print(f"[ComfyUI-Nuvu] Pending install error: {e}", flush=True)
+    
+    plain = [entry for entry in pending if not any(part.startswith('-') for part in entry[2])]
+    if len(plain) > 1:
+        merged_parts = list(dict.fromkeys(part for _, _, spec_parts in plain for part in spec_parts))
+        try:
+            result = _install_pending_spec(merged_parts, uv_path)
+            if result.returncode == 0:
+                for marker_path, package_spec, _ in plain:
+                    print(f"[ComfyUI-Nuvu] Successfully installed {package_spec}", flush=True)
+                    os.remove(marker_path)
+                pending = [entry for entry in pending if entry not in plain]
             else:
-                cmd = [sys.executable]
-                if is_embedded:
-                    cmd.append('-s')
-                cmd.extend(['-m', 'pip', 'install'] + spec_parts)
-            
-            print(f"[ComfyUI-Nuvu] Installing: {' '.join(cmd)}", flush=True)
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+                print(f"[ComfyUI-Nuvu] Batched pending install failed, retrying each: {result.stderr[:500]}", flush=True)
+        except subprocess.TimeoutExpired:
+            # Retrying each one would just time out again
+            for marker_path, package_spec, _ in plain:
+                print(f"[ComfyUI-Nuvu] Pending install timed out: {package_spec}", flush=True)
+                try:
+                    os.remove(marker_path)
+                except Exception:
+                    pass
+            pending = [entry for entry in pending if entry not in plain]
+        except Exception as e:
+            print(f"[ComfyUI-Nuvu] Batched pending install error: {e}", flush=True)
+    
+    for marker_path, package_spec, spec_parts in pending:
+        try:
+            result = _install_pending_spec(spec_parts, uv_path)
             
             if result.returncode == 0:
                 print(f"[ComfyUI-Nuvu] Successfully installed {package_spec}", flush=True)
@@ -807,33 +1692,95 @@ def _install_pending_requirements():
     # This must happen before any installs to avoid version comparison errors
     _cleanup_corrupted_packages()
     
+    # Collect every repo whose requirements need installing: Nuvu, ComfyUI,
+    # and custom nodes that were marked for retry
+    targets = [("Nuvu", _script_dir)]
+    pending_nodes = []
+    comfyui_root = _detect_comfyui_root()
+    if comfyui_root:
+        targets.append(("ComfyUI", comfyui_root))
+        custom_nodes_dir = os.path.join(comfyui_root, 'custom_nodes')
+        pending_nodes = _get_custom_nodes_with_pending_requirements(custom_nodes_dir)
+        if pending_nodes:
+            _get_logger().info("[ComfyUI-Nuvu] Found %s custom node(s) with pending requirements", len(pending_nodes))
+    
+    # This one stat/hash pass plus two marker directory scans is the whole
+    # warm path: when nothing is pending we return without waiting on the
+    # uv install thread or touching the environment
+    targets = [(name, path) for name, path in targets if _requirements_install_needed(path)]
+    pending_nodes = [(n, p) for n, p in pending_nodes if _requirements_install_needed(p)]
+    needed = targets + [(f"Custom Node: {n}", p) for n, p in pending_nodes]
+    uninstall_markers = _get_all_pending_uninstall_markers()
+    install_markers = _list_pending_markers('pending_installs')
+    if not needed and not uninstall_markers and not install_markers:
+        return
+    
     # Use uv if available for faster installs
     uv_path = _find_uv()
     
     # Handle pending package uninstalls FIRST (before anything loads .pyd files)
     # These are also handled by pre_launch.py, but we run here as fallback
-    _run_pending_uninstalls(uv_path)
+    _run_pending_uninstalls(uv_path, uninstall_markers)
     
     # Handle pending package installs (for packages that failed due to locked files)
     # May fail here due to file locks, but will create new markers for next restart
-    _run_pending_installs(uv_path)
+    _run_pending_installs(uv_path, install_markers)
     
-    # Install Nuvu requirements
-    _run_requirements_install("Nuvu", _script_dir, "requirements.txt", uv_path)
+    if not needed:
+        return
     
-    # Install ComfyUI requirements (if pending)
-    comfyui_root = _detect_comfyui_root()
-    if comfyui_root:
-        _run_requirements_install("ComfyUI", comfyui_root, "requirements.txt", uv_path)
-        
-        # Install custom nodes requirements (if pending)
-        custom_nodes_dir = os.path.join(comfyui_root, 'custom_nodes')
-        pending_nodes = _get_custom_nodes_with_pending_requirements(custom_nodes_dir)
+    # A changed requirements file is often already satisfied (a comment or an
+    # order change, or the packages arrived some other way) - check locally
+    # before paying for an installer process
+    installed = _installed_distribution_versions()
+    satisfied = {
+        path for _, path in needed
+        if _requirements_satisfied(os.path.join(path, 'requirements.txt'), installed)
+    }
+    for name, path in needed:
+        if path in satisfied:
+            _get_logger().debug("[ComfyUI-Nuvu] %s requirements already satisfied", name)
+            _mark_requirements_installed(path)
+            _remove_pending_install_marker(path)
+    targets = [(name, path) for name, path in targets if path not in satisfied]
+    pending_nodes = [(n, p) for n, p in pending_nodes if p not in satisfied]
+    needed = [(name, path) for name, path in needed if path not in satisfied]
+    if not needed:
+        return
+    
+    # With uv, install them all in one resolver pass; fall back to per-repo
+    # installs (which pinpoint the failing repo) if that doesn't work out.
+    # Files with cwd-relative entries always install from their own repo.
+    batchable = uv_path and len(needed) > 1 and all(
+        _requirements_batchable(os.path.join(path, 'requirements.txt')) for _, path in needed
+    )
+    if batchable and _run_requirements_install_batch(needed, uv_path):
+        return
+    
+    # Install Nuvu requirements, then ComfyUI requirements (if pending)
+    for name, path in targets:
+        _run_requirements_install(name, path, "requirements.txt", uv_path)
+    
+    # Install custom nodes requirements (if pending)
+    # uv locks the target environment while it writes, so node installs can
+    # overlap their resolve/download phases safely. pip has no such lock,
+    # so without uv the nodes are installed one at a time.
+    if uv_path and len(pending_nodes) > 1:
+        from concurrent.futures import ThreadPoolExecutor
         
-        if pending_nodes:
-            logger.info(f"[ComfyUI-Nuvu] Found {len(pending_nodes)} custom node(s) with pending requirements")
-            for node_name, node_path in pending_nodes:
-                _run_requirements_install(f"Custom Node: {node_name}", node_path, "requirements.txt", uv_path)
+        # Installs are network/disk bound; past ~8 concurrent jobs mirrors and
+        # proxies start throttling, so more workers stop paying off
+        max_workers = min(os.cpu_count() or 4, 8, len(pending_nodes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_buffered_requirements_install, f"Custom Node: {node_name}", node_path, "requirements.txt", uv_path)
+                for node_name, node_path in pending_nodes
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for node_name, node_path in pending_nodes:
+            _run_requirements_install(f"Custom Node: {node_name}", node_path, "requirements.txt", uv_path)
 
 
 # =============================================================================
@@ -863,142 +1810,144 @@ CRITICAL_PACKAGES = [
 ]
 
 
+def _invalidate_installed_cache():
+    """Forget cached package lookups after installing or removing packages."""
+    _check_package_installed.cache_clear()
+    _dist_info_counts.cache_clear()
+    importlib.invalidate_caches()
+
+
+@functools.lru_cache(maxsize=None)
 def _check_package_installed(pip_name: str) -> bool:
     """
-    Check if a package is installed using pip show (without importing it).
+    Check if a package is installed from its metadata (without importing it).
     
     This avoids loading/locking module files, which is important for packages
-    that might be in a broken state and need reinstallation.
+    that might be in a broken state and need reinstallation. importlib.metadata
+    reads the dist-info in-process, so no pip subprocess is needed.
     """
-    is_embedded = "python_embeded" in sys.executable.lower()
-    
-    if is_embedded:
-        cmd = [sys.executable, '-s', '-m', 'pip', 'show', pip_name]
-    else:
-        cmd = [sys.executable, '-m', 'pip', 'show', pip_name]
+    from importlib.metadata import distribution, PackageNotFoundError
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        # pip show returns 0 if package is found, non-zero if not
-        if result.returncode != 0:
-            return False
-        
-        # Also check that the Location exists and isn't empty
-        # This catches partially uninstalled packages
-        for line in result.stdout.splitlines():
-            if line.startswith('Location:'):
-                location = line.split(':', 1)[1].strip()
-                if not location or not os.path.isdir(location):
-                    return False
-                break
-        
-        return True
+        dist = distribution(pip_name)
+    except PackageNotFoundError:
+        return False
     except Exception:
         return False
+    
+    # Also check that the location exists and isn't empty
+    # This catches partially uninstalled packages
+    location = str(dist.locate_file(''))
+    return bool(location) and os.path.isdir(location)
+
 
+def _check_packages_installed(pip_names):
+    """Run _check_package_installed for several packages. Returns {pip_name: bool}."""
+    return {name: _check_package_installed(name) for name in pip_names}
 
-def _install_package(package_spec: str, description: str) -> bool:
+
+def _install_packages(packages) -> bool:
     """
-    Force reinstall a package using pip.
+    Force reinstall several packages using a single pip process.
     
     NOTE: We always use pip here instead of uv for reliability.
     uv can leave packages in broken states when interrupted.
     
     Args:
-        package_spec: Package specification (e.g., "pillow" or "pillow>=10.0.0")
-        description: Human-readable name for logging
+        packages: List of (package_spec, description) tuples, where package_spec
+            is e.g. "pillow" or "pillow>=10.0.0" and description is a
+            human-readable name for logging
     
     Returns:
         True if installation succeeded, False otherwise
     """
-    print(f"[ComfyUI-Nuvu] {description} is missing or broken, reinstalling...", flush=True)
+    if not packages:
+        return True
     
-    is_embedded = "python_embeded" in sys.executable.lower()
+    names = ', '.join(description for _, description in packages)
+    print(f"[ComfyUI-Nuvu] {names} missing or broken, reinstalling...", flush=True)
     
     # Always use pip in prestartup for reliability
-    if is_embedded:
-        cmd = [sys.executable, '-s', '-m', 'pip', 'install', '--force-reinstall', package_spec]
-    else:
-        cmd = [sys.executable, '-m', 'pip', 'install', '--force-reinstall', package_spec]
+    cmd = [*_PIP_INSTALL, '--force-reinstall', *(spec for spec, _ in packages)]
     
     try:
         result = subprocess.run(
             cmd,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=120,
+            timeout=120 * len(packages),
         )
         
+        _invalidate_installed_cache()
         if result.returncode == 0:
-            print(f"[ComfyUI-Nuvu] {description} reinstalled successfully", flush=True)
+            print(f"[ComfyUI-Nuvu] {names} reinstalled successfully", flush=True)
             return True
         else:
-            print(f"[ComfyUI-Nuvu] {description} reinstall failed: {result.stderr[:200]}", flush=True)
+            print(f"[ComfyUI-Nuvu] {names} reinstall failed: {result.stderr[:200]}", flush=True)
             return False
     except Exception as e:
-        print(f"[ComfyUI-Nuvu] {description} reinstall error: {e}", flush=True)
+        print(f"[ComfyUI-Nuvu] {names} reinstall error: {e}", flush=True)
         return False
 
 
+# site-packages fingerprint from the last corrupted-package scan that came up clean
+_clean_scan_key = None
+
+
 def _cleanup_corrupted_packages():
     """Find and delete packages with 'None' version (corrupted metadata).
     
     These packages have broken metadata that prevents proper version comparison.
     Force deleting them allows a clean reinstall.
+    
+    Scans importlib.metadata in-process (as pre_launch.py does) instead of
+    running `pip list`. A repeat call is skipped when site-packages hasn't
+    changed since a clean scan. Returns True if anything was deleted.
     """
-    is_embedded = "python_embeded" in sys.executable.lower()
+    global _clean_scan_key
+    from importlib.metadata import distributions
     
-    pip_base = [sys.executable]
-    if is_embedded:
-        pip_base.append('-s')
-    pip_base.extend(['-m', 'pip'])
+    # Startup runs this before the pending installs and again before the
+    # critical checks; the second pass only matters if something was installed
+    scan_key = _environment_key(b'')
+    if scan_key == _clean_scan_key:
+        return False
     
     try:
-        # Run pip list to get all packages
-        cmd = list(pip_base) + ['list', '--format=freeze']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode != 0:
-            return
-        
         corrupted = []
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            # Format is "package==version" or just "package" if version is missing
-            if '==' in line:
-                pkg, version = line.split('==', 1)
-                if version.lower() == 'none' or not version:
-                    corrupted.append(pkg)
-            elif '==' not in line and '@' not in line:
-                # Package with no version at all
-                corrupted.append(line)
-        
-        # Also check regular pip list format for "None" versions
-        cmd2 = list(pip_base) + ['list']
-        result2 = subprocess.run(cmd2, capture_output=True, text=True, timeout=30)
-        if result2.returncode == 0:
-            for line in result2.stdout.splitlines():
-                parts = line.split()
-                if len(parts) >= 2 and parts[1].lower() == 'none':
-                    pkg = parts[0]
-                    if pkg not in corrupted:
-                        corrupted.append(pkg)
+        for dist in distributions():
+            try:
+                name = dist.metadata['Name']
+                version = dist.version
+            except Exception:
+                # METADATA itself is unreadable - fall back to the dist-info directory name
+                name = None
+                version = None
+            
+            if not name:
+                path = getattr(dist, '_path', None)
+                if path is None:
+                    continue
+                name = os.path.basename(str(path)).split('-', 1)[0]
+            
+            if not version or str(version).lower() == 'none':
+                if name not in corrupted:
+                    corrupted.append(name)
         
         if corrupted:
             print(f"[ComfyUI-Nuvu] Found {len(corrupted)} corrupted package(s): {', '.join(corrupted)}", flush=True)
             for pkg in corrupted:
                 print(f"[ComfyUI-Nuvu] Force deleting corrupted: {pkg}", flush=True)
                 _force_delete_package(pkg)
+            _invalidate_installed_cache()
+            return True
+        
+        _clean_scan_key = scan_key
     
     except Exception as e:
-        logger.debug(f"[ComfyUI-Nuvu] Error checking for corrupted packages: {e}")
+        _get_logger().debug("[ComfyUI-Nuvu] Error checking for corrupted packages: %s", e)
+    return False
 
 
 def _get_installed_version(pip_name: str) -> str:
@@ -1018,49 +1967,24 @@ def _get_installed_version(pip_name: str) -> str:
 
 
 def _version_satisfies_constraint(installed_version: str, constraint: str) -> bool:
-    """Check if installed version satisfies a version constraint like '<1.0' or '>=0.34.0'."""
+    """Check if installed version satisfies a version constraint like '<1.0' or '>=0.34.0'.
+    
+    Uses packaging so pre-releases, post-releases, epochs and local versions
+    (e.g. '2.4.0+cu121') compare correctly. An installed pre-release counts
+    if it is in range, since it is already there.
+    """
     if not installed_version:
         return False
     
     try:
-        # Parse the constraint
-        import re
-        match = re.match(r'^([<>=!]+)(.+)$', constraint)
-        if not match:
-            return True  # No constraint, any version is fine
-        
-        op, required = match.groups()
-        
-        # Parse versions into tuples for comparison
-        def parse_version(v):
-            # Handle versions like "1.2.3" or "0.34.0"
-            parts = []
-            for part in v.split('.'):
-                # Extract numeric prefix
-                num_match = re.match(r'^(\d+)', part)
-                if num_match:
-                    parts.append(int(num_match.group(1)))
-                else:
-                    parts.append(0)
-            return tuple(parts)
-        
-        installed = parse_version(installed_version)
-        required_v = parse_version(required)
-        
-        if op == '<':
-            return installed < required_v
-        elif op == '<=':
-            return installed <= required_v
-        elif op == '>':
-            return installed > required_v
-        elif op == '>=':
-            return installed >= required_v
-        elif op == '==':
-            return installed == required_v
-        elif op == '!=':
-            return installed != required_v
-        else:
-            return True
+        from packaging.specifiers import SpecifierSet
+        from packaging.version import Version
+    except ImportError:
+        # Fall back to the basic numeric comparison
+        return _version_satisfies_spec(installed_version, constraint)
+    
+    try:
+        return SpecifierSet(constraint).contains(Version(installed_version), prereleases=True)
     except Exception:
         return False  # If we can't parse, assume it doesn't satisfy
 
@@ -1079,13 +2003,12 @@ def _uninstall_package(pip_name: str) -> bool:
     
     Returns True if uninstall succeeded, False otherwise.
     """
-    is_embedded = "python_embeded" in sys.executable.lower()
-    
-    if is_embedded:
+    _invalidate_installed_cache()
+    if _IS_EMBEDDED:
         # First uninstall from embedded site-packages
-        cmd1 = [sys.executable, '-s', '-m', 'pip', 'uninstall', '-y', pip_name]
+        cmd1 = [*_PIP_UNINSTALL, pip_name]
         try:
-            subprocess.run(cmd1, capture_output=True, text=True, timeout=60)
+            subprocess.run(cmd1, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
         except Exception:
             pass
         
@@ -1093,7 +2016,7 @@ def _uninstall_package(pip_name: str) -> bool:
         # ComfyUI-Manager restarts without -s flag and Python sees user packages)
         cmd2 = [sys.executable, '-m', 'pip', 'uninstall', '-y', pip_name]
         try:
-            result = subprocess.run(cmd2, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(cmd2, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
             if result.returncode != 0:
                 # pip failed, force delete from both locations
                 _force_delete_package(pip_name)
@@ -1101,9 +2024,9 @@ def _uninstall_package(pip_name: str) -> bool:
             _force_delete_package(pip_name)
     else:
         # Non-embedded Python - just uninstall normally
-        cmd = [sys.executable, '-m', 'pip', 'uninstall', '-y', pip_name]
+        cmd = [*_PIP_UNINSTALL, pip_name]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
             if result.returncode != 0:
                 _force_delete_package(pip_name)
         except Exception:
@@ -1112,6 +2035,30 @@ def _uninstall_package(pip_name: str) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _dist_info_counts():
+    """Count .dist-info directories per normalized package name across site-packages.
+    
+    Each site-packages directory is listed once, however many packages are checked.
+    """
+    counts = {}
+    for sp_dir in _site_packages_dirs():
+        try:
+            with os.scandir(sp_dir) as entries:
+                for entry in entries:
+                    item = entry.name
+                    # Match package_name-version.dist-info
+                    if not item.endswith('.dist-info'):
+                        continue
+                    # Extract package name from dist-info (format: name-version.dist-info)
+                    dist_name = item[:-len('.dist-info')].rsplit('-', 1)[0]
+                    dist_name_normalized = dist_name.replace('-', '_').lower()
+                    counts[dist_name_normalized] = counts.get(dist_name_normalized, 0) + 1
+        except OSError:
+            continue
+    return counts
+
+
 def _has_conflicting_versions(pip_name: str) -> bool:
     """
     Check if a package has multiple dist-info directories (conflicting versions).
@@ -1122,38 +2069,13 @@ def _has_conflicting_versions(pip_name: str) -> bool:
     
     Returns True if multiple dist-info directories exist, False otherwise.
     """
-    import site
-    import re
-    
     # Normalize package name (pip uses underscores internally)
     normalized_name = pip_name.replace('-', '_').lower()
-    
-    # Get site-packages directories
-    site_packages_dirs = site.getsitepackages()
-    if hasattr(site, 'getusersitepackages'):
-        user_site = site.getusersitepackages()
-        if user_site:
-            site_packages_dirs.append(user_site)
-    
-    total_dist_infos = 0
-    
-    for sp_dir in site_packages_dirs:
-        if not sp_dir or not os.path.isdir(sp_dir):
-            continue
-        
-        try:
-            for item in os.listdir(sp_dir):
-                # Match package_name-version.dist-info
-                if item.endswith('.dist-info'):
-                    # Extract package name from dist-info (format: name-version.dist-info)
-                    dist_name = item.rsplit('-', 1)[0] if '-' in item else item[:-10]
-                    dist_name_normalized = dist_name.replace('-', '_').lower()
-                    if dist_name_normalized == normalized_name:
-                        total_dist_infos += 1
-        except Exception:
-            continue
-    
-    return total_dist_infos > 1
+    return _dist_info_counts().get(normalized_name, 0) > 1
+
+
+# Version constraint at the end of a package spec ("huggingface_hub<1.0" -> "<1.0")
+_CONSTRAINT_RE = re.compile(r'([<>=!]+.+)$')
 
 
 def _ensure_critical_packages():
@@ -1164,7 +2086,7 @@ def _ensure_critical_packages():
     they will be force reinstalled. This can happen when package upgrades fail mid-way
     (e.g., PyTorch upgrade that tries to reinstall dependencies but fails due to locked files).
     
-    Uses pip show to check packages WITHOUT importing them, which avoids loading/locking
+    Uses importlib.metadata to check packages WITHOUT importing them, which avoids loading/locking
     broken module files that would prevent reinstallation.
     
     For packages with version constraints (force_version=True), check if the installed
@@ -1172,19 +2094,40 @@ def _ensure_critical_packages():
     conflicting versions exist (pip sees one version but Python imports another), we
     explicitly uninstall before reinstalling.
     """
+    # Nothing below needs to run if the environment hasn't changed since
+    # every critical package last checked out
+    verified_file = os.path.join(_script_dir, '.nuvu', 'critical_packages.verified')
+    verify_key = None
+    try:
+        verify_key = _environment_key(repr(CRITICAL_PACKAGES).encode())
+        with open(verified_file, 'r') as f:
+            if f.read().strip() == verify_key:
+                print("[ComfyUI-Nuvu] Critical packages OK (cached)", flush=True)
+                return
+    except OSError:
+        pass
+    
     print(f"[ComfyUI-Nuvu] Checking {len(CRITICAL_PACKAGES)} critical packages...", flush=True)
     
     # Clean up any packages with corrupted metadata (version = None)
     # Also called earlier in _install_pending_requirements(), but run again here
     # in case new corrupted packages were created during pending installs
-    _cleanup_corrupted_packages()
+    _invalidate_installed_cache()
+    changed = _cleanup_corrupted_packages()
+    
+    # Packages without a version constraint only need an installed check - run those together
+    installed = _check_packages_installed([
+        pip_name for pip_name, _, _, force_version in CRITICAL_PACKAGES if not force_version
+    ])
+    
+    # Everything that needs reinstalling goes through one pip process at the end
+    to_install = []
     
     for pip_name, package_spec, description, force_version in CRITICAL_PACKAGES:
         if force_version:
             # Check if installed version satisfies the constraint
             # Extract constraint from package_spec (e.g., "huggingface_hub<1.0" -> "<1.0")
-            import re
-            match = re.search(r'([<>=!]+.+)$', package_spec)
+            match = _CONSTRAINT_RE.search(package_spec)
             if match:
                 constraint = match.group(1)
                 installed_version = _get_installed_version(pip_name)
@@ -1196,7 +2139,8 @@ def _ensure_critical_packages():
                     # but Python could import another. Force clean reinstall.
                     print(f"[ComfyUI-Nuvu] {pip_name} has conflicting versions, will uninstall and reinstall", flush=True)
                     _uninstall_package(pip_name)
-                    _install_package(package_spec, description)
+                    changed = True
+                    to_install.append((package_spec, description))
                     continue
                 
                 if installed_version and _version_satisfies_constraint(installed_version, constraint):
@@ -1208,10 +2152,19 @@ def _ensure_critical_packages():
                 # Explicitly uninstall first to remove ALL conflicting versions
                 # This handles cases where pip sees one version but Python imports another
                 _uninstall_package(pip_name)
+                changed = True
             # Version doesn't satisfy constraint or not installed
-            _install_package(package_spec, description)
-        elif not _check_package_installed(pip_name):
-            _install_package(package_spec, description)
+            to_install.append((package_spec, description))
+        elif not installed[pip_name]:
+            to_install.append((package_spec, description))
+    
+    if to_install:
+        _install_packages(to_install)
+    elif not changed and verify_key:
+        try:
+            _write_text_atomic(verified_file, verify_key)
+        except OSError:
+            pass
 
 
 def _patch_batch_files():
@@ -1223,15 +2176,13 @@ def _patch_batch_files():
     
     This runs once on first prestartup and modifies the batch files in-place.
     """
-    is_embedded = "python_embeded" in sys.executable.lower()
-    
     # Find ComfyUI root directory
     # prestartup runs from custom_nodes/ComfyUI-Nuvu-Packager/
     packager_dir = os.path.dirname(os.path.abspath(__file__))
     custom_nodes_dir = os.path.dirname(packager_dir)
     comfyui_dir = os.path.dirname(custom_nodes_dir)
     
-    if is_embedded:
+    if _IS_EMBEDDED:
         # Portable install: batch file is in parent of ComfyUI folder
         # Structure: portable_root/ComfyUI/custom_nodes/...
         portable_root = os.path.dirname(comfyui_dir)
@@ -1244,21 +2195,52 @@ def _patch_batch_files():
             'run.bat',
         ]
         
-        for batch_name in batch_candidates:
-            batch_path = os.path.join(portable_root, batch_name)
-            if os.path.isfile(batch_path):
-                _patch_portable_batch(batch_path)
+        batch_paths = [
+            os.path.join(portable_root, batch_name) for batch_name in batch_candidates
+            if os.path.isfile(os.path.join(portable_root, batch_name))
+        ]
+        if len(batch_paths) > 1:
+            # Each file is read and rewritten on its own, so overlap the I/O
+            # (portable installs often live on slow USB or network drives)
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=len(batch_paths)) as executor:
+                list(executor.map(functools.partial(_patch_batch_once, _patch_portable_batch), batch_paths))
+        else:
+            for batch_path in batch_paths:
+                _patch_batch_once(_patch_portable_batch, batch_path)
     else:
         # Venv install: batch file is in ComfyUI folder
         batch_path = os.path.join(comfyui_dir, 'run_comfy.bat')
         venv_path = os.path.join(comfyui_dir, 'venv')
         
         if os.path.isfile(batch_path):
-            _patch_venv_batch(batch_path)
+            _patch_batch_once(_patch_venv_batch, batch_path)
         elif os.path.isdir(venv_path):
             # Create run_comfy.bat if it doesn't exist but venv does
             _create_venv_batch(batch_path)
-            _patch_venv_batch(batch_path)
+            _patch_batch_once(_patch_venv_batch, batch_path)
+
+
+def _patch_batch_once(patch, batch_path):
+    """Run patch(batch_path) unless the file is unchanged since it was last patched.
+    
+    The batch file's size and mtime are stamped in .nuvu/ after a successful
+    patch, so later startups skip reading it.
+    """
+    stamp_path = os.path.join(_script_dir, '.nuvu', f'patched_{os.path.basename(batch_path)}')
+    try:
+        with open(stamp_path, 'r') as f:
+            if f.read().strip() == _stat_key(batch_path):
+                return
+    except OSError:
+        pass
+    
+    if patch(batch_path):
+        try:
+            _write_text_atomic(stamp_path, _stat_key(batch_path))
+        except OSError:
+            pass
 
 
 def _patch_portable_batch(batch_path):
@@ -1274,7 +2256,7 @@ def _patch_portable_batch(batch_path):
         
         # Already patched with correct path?
         if correct_path in content:
-            return
+            return True
         
         # Check if patched with old path - upgrade it
         if old_path in content:
@@ -1282,21 +2264,25 @@ def _patch_portable_batch(batch_path):
             with open(batch_path, 'w', encoding='utf-8') as f:
                 f.write(new_content)
             print(f"[ComfyUI-Nuvu] Upgraded {os.path.basename(batch_path)} pre_launch.py path", flush=True)
-            return
+            return True
         
         # Not patched at all - add pre_launch.py
         lines = content.splitlines()
         new_lines = []
+        changed = False
         
         for line in lines:
             # Skip old patch lines (any previous force-reinstall or requirements install lines we added)
-            if '--force-reinstall pillow' in line.lower():
+            lower = line.lower()
+            if '--force-reinstall pillow' in lower:
+                changed = True
                 continue
-            if 'pip install -r' in line.lower() and 'requirements.txt' in line.lower():
+            if 'pip install -r' in lower and 'requirements.txt' in lower:
+                changed = True
                 continue
             
             # Find the line that runs main.py
-            if 'python' in line.lower() and 'main.py' in line.lower():
+            if 'python' in lower and 'main.py' in lower:
                 # Extract the python executable path from this line
                 # e.g., ".\python_embeded\python.exe -s ComfyUI\main.py ..."
                 parts = line.split()
@@ -1305,20 +2291,22 @@ def _patch_portable_batch(batch_path):
                     # Run pre_launch.py which handles everything
                     prelaunch_line = f'{python_exe} -s ComfyUI\\custom_nodes\\{correct_path}'
                     new_lines.append(prelaunch_line)
+                    changed = True
             
             new_lines.append(line)
         
-        new_content = '\n'.join(new_lines)
-        
-        # Only write if changed
-        if new_content != content:
+        # Only write if a line was dropped or added - comparing the rejoined text
+        # would also flag the dropped trailing newline and rewrite the file every time
+        if changed:
             with open(batch_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+                f.write('\n'.join(new_lines))
             print(f"[ComfyUI-Nuvu] Patched {os.path.basename(batch_path)} to run pre_launch.py on startup", flush=True)
+        return True
     
     except Exception as e:
         # Don't fail prestartup if patching fails
         print(f"[ComfyUI-Nuvu] Could not patch {batch_path}: {e}", flush=True)
+        return False
 
 
 def _create_venv_batch(batch_path):
@@ -1354,7 +2342,7 @@ def _patch_venv_batch(batch_path):
         
         # Already patched with correct path?
         if correct_path in content:
-            return
+            return True
         
         # Check if patched with old path - upgrade it
         if old_path in content:
@@ -1362,44 +2350,57 @@ def _patch_venv_batch(batch_path):
             with open(batch_path, 'w', encoding='utf-8') as f:
                 f.write(new_content)
             print(f"[ComfyUI-Nuvu] Upgraded {os.path.basename(batch_path)} pre_launch.py path", flush=True)
-            return
+            return True
         
         # Not patched at all - add pre_launch.py
         lines = content.splitlines()
         new_lines = []
+        changed = False
         
         for line in lines:
             # Skip old patch lines (any previous force-reinstall or requirements install lines we added)
-            if '--force-reinstall pillow' in line.lower():
+            lower = line.lower()
+            if '--force-reinstall pillow' in lower:
+                changed = True
                 continue
-            if 'pip install -r' in line.lower() and 'requirements.txt' in line.lower():
+            if 'pip install -r' in lower and 'requirements.txt' in lower:
+                changed = True
                 continue
             
             # Find the line that runs main.py
-            if 'python' in line.lower() and 'main.py' in line.lower():
+            if 'python' in lower and 'main.py' in lower:
                 # Run pre_launch.py which handles everything: pending installs, critical packages, requirements
                 prelaunch_line = f'python custom_nodes\\{correct_path}'
                 new_lines.append(prelaunch_line)
+                changed = True
             
             new_lines.append(line)
         
-        new_content = '\n'.join(new_lines)
-        
-        # Only write if changed
-        if new_content != content:
+        # Only write if a line was dropped or added - comparing the rejoined text
+        # would also flag the dropped trailing newline and rewrite the file every time
+        if changed:
             with open(batch_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+                f.write('\n'.join(new_lines))
             print(f"[ComfyUI-Nuvu] Patched {os.path.basename(batch_path)} to run pre_launch.py on startup", flush=True)
+        return True
     
     except Exception as e:
         # Don't fail prestartup if patching fails
         print(f"[ComfyUI-Nuvu] Could not patch {batch_path}: {e}", flush=True)
+        return False
+
 
+# Requirement line: name, optional [extras], then the version spec
+_REQ_RE = re.compile(r'^([a-zA-Z0-9_-]+)(\[[^\]]+\])?(.*)$')
 
+
+@functools.lru_cache(maxsize=4096)
 def _parse_requirement(req_line: str):
-    """Parse a requirement line into (package_name, version_spec) or None if invalid."""
-    import re
+    """Parse a requirement line into (package_name, version_spec) or None if invalid.
     
+    Cached on the raw line: custom nodes repeat the same pins (numpy, torch...)
+    across their requirements files.
+    """
     req_line = req_line.strip()
     
     # Skip comments and empty lines
@@ -1416,7 +2417,7 @@ def _parse_requirement(req_line: str):
     
     # Extract package name and version spec
     # Patterns: package>=1.0, package==1.0, package<2.0, package[extra]>=1.0
-    match = re.match(r'^([a-zA-Z0-9_-]+)(\[[^\]]+\])?(.*)$', req_line)
+    match = _REQ_RE.match(req_line)
     if match:
         pkg_name = match.group(1)
         version_spec = match.group(3).strip() if match.group(3) else ''
@@ -1425,8 +2426,12 @@ def _parse_requirement(req_line: str):
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def _version_satisfies_spec(installed_version: str, version_spec: str) -> bool:
-    """Check if installed version satisfies the version specification."""
+    """Check if installed version satisfies the version specification.
+    
+    Cached, since each check parses both the version and the SpecifierSet.
+    """
     if not version_spec or not installed_version:
         return installed_version is not None
     
@@ -1473,6 +2478,34 @@ def _version_satisfies_spec(installed_version: str, version_spec: str) -> bool:
         return True
 
 
+def _get_verified_requirements_file():
+    """Stamp recording the last ComfyUI requirements check that found nothing to do."""
+    return os.path.join(_script_dir, '.nuvu', 'comfyui_requirements.verified')
+
+
+def _environment_key(data):
+    """Fingerprint data (bytes) together with the state of site-packages.
+    
+    Installing, upgrading or removing a package renames or adds a top-level
+    entry in site-packages, which bumps the directory's mtime, so an unchanged
+    key means a check that passed last time still holds.
+    """
+    h = hashlib.blake2b(data, digest_size=8)
+    for sp_dir in _site_packages_dirs():
+        try:
+            h.update(f"|{sp_dir}:{os.stat(sp_dir).st_mtime_ns}".encode())
+        except OSError:
+            pass
+    h.update(_interpreter_key().encode())
+    return h.hexdigest()
+
+
+def _requirements_verify_key(requirements_path):
+    """Fingerprint requirements.txt together with the state of site-packages."""
+    with open(requirements_path, 'rb') as f:
+        return _environment_key(f.read())
+
+
 def _verify_comfyui_requirements():
     """Verify ComfyUI requirements.txt packages are installed with correct versions.
     
@@ -1493,6 +2526,19 @@ def _verify_comfyui_requirements():
         print("[ComfyUI-Nuvu] No requirements.txt found", flush=True)
         return
     
+    # Skip the per-package checks if neither the file nor the environment
+    # changed since they last passed
+    verified_file = _get_verified_requirements_file()
+    verify_key = None
+    try:
+        verify_key = _requirements_verify_key(requirements_path)
+        with open(verified_file, 'r') as f:
+            if f.read().strip() == verify_key:
+                print("[ComfyUI-Nuvu] ComfyUI requirements unchanged since last check", flush=True)
+                return
+    except OSError:
+        pass
+    
     missing_packages = []
     wrong_version_packages = []
     
@@ -1518,25 +2564,26 @@ def _verify_comfyui_requirements():
     
     if not packages_to_install:
         print("[ComfyUI-Nuvu] All ComfyUI requirements satisfied", flush=True)
+        if verify_key:
+            try:
+                _write_text_atomic(verified_file, verify_key)
+            except OSError:
+                pass
         return
     
     print(f"[ComfyUI-Nuvu] Installing {len(packages_to_install)} missing/outdated requirement(s)...", flush=True)
     for pkg in packages_to_install:
         print(f"[ComfyUI-Nuvu]   - {pkg}", flush=True)
     
-    is_embedded = "python_embeded" in sys.executable.lower()
     uv_path = _find_uv()
     
     if uv_path:
         cmd = [uv_path, 'pip', 'install']
-        if is_embedded:
+        if _IS_EMBEDDED:
             cmd.extend(['--python', sys.executable])
         cmd.extend(packages_to_install)
     else:
-        cmd = [sys.executable]
-        if is_embedded:
-            cmd.append('-s')
-        cmd.extend(['-m', 'pip', 'install'] + packages_to_install)
+        cmd = [*_PIP_INSTALL, *packages_to_install]
     
     # Add torch index URL if available
     torch_index = get_torch_index_url()
@@ -1544,7 +2591,7 @@ def _verify_comfyui_requirements():
         cmd.extend(['--extra-index-url', torch_index])
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=600)
         if result.returncode != 0:
             print(f"[ComfyUI-Nuvu] Requirements install error: {result.stderr[:300]}", flush=True)
         else:
@@ -1555,8 +2602,14 @@ def _verify_comfyui_requirements():
 
 # Run on module load (prestartup phase)
 try:
-    # Install uv if not present (used by pre_launch.py for faster installs)
-    _install_uv()
+    # Install uv if not present (used by pre_launch.py for faster installs).
+    # Runs in the background so a first-time download doesn't block startup;
+    # _find_uv() waits for it before anything needs uv. When a previous launch
+    # already recorded uv, _install_uv would return at once, so skip the thread.
+    if _cached_uv_path and not os.environ.get('NUVU_UV_REVALIDATE'):
+        _uv_ready.set()
+    else:
+        threading.Thread(target=_install_uv_in_background, name="nuvu-uv-install", daemon=True).start()
     
     # Patch batch files to install requirements before main.py (runs once)
     _patch_batch_files()
@@ -1571,10 +2624,10 @@ try:
     # Ensure critical packages are installed and working
     _ensure_critical_packages()
     
-    # Verify ComfyUI requirements.txt packages are installed with correct versions
-    _verify_comfyui_requirements()
-    
     # Clean up orphaned dist-info directories after install
     _cleanup_orphaned_dist_info()
+    
+    # Verify ComfyUI requirements.txt packages are installed with correct versions
+    _verify_comfyui_requirements()
 except Exception as e:
-    logger.warning(f"[ComfyUI-Nuvu] Prestartup error (non-fatal): {e}")
+    _get_logger().warning("[ComfyUI-Nuvu] Prestartup error (non-fatal): %s", e)